@@ -1,19 +1,22 @@
 from __future__ import annotations
 
-from backpy.core.config.configuration import TOMLConfiguration
-from backpy.core.config.variables import VariableLibrary
+import importlib
 
-VariableLibrary()
-
-from backpy.core.backup import compression
-from backpy.core.utils.times import TimeObject
-from backpy.core.remote import Remote, Protocol
-
-# Import in the correct order to avoid circular imports
-from backpy.core.backup.types import BackupSpaceType
-from backpy.core.backup.backup_space import BackupSpace
-from backpy.core.backup.backup import Backup
-from backpy.core.backup.file_backup_space import FileBackupSpace
+# Lazily resolve the public re-exports (PEP 562) so that 'import backpy'
+# does not pull in the whole core package. The attribute is imported from
+# its defining module on first access and cached in the module globals.
+_LAZY_IMPORTS = {
+    "TOMLConfiguration": "backpy.core.config.configuration",
+    "VariableLibrary": "backpy.core.config.variables",
+    "compression": "backpy.core.backup.compression",
+    "TimeObject": "backpy.core.utils.times",
+    "Remote": "backpy.core.remote",
+    "Protocol": "backpy.core.remote",
+    "BackupSpaceType": "backpy.core.backup.types",
+    "BackupSpace": "backpy.core.backup.backup_space",
+    "Backup": "backpy.core.backup.backup",
+    "FileBackupSpace": "backpy.core.backup.file_backup_space",
+}
 
 __all__ = [
     "FileBackupSpace",
@@ -27,3 +30,24 @@ __all__ = [
     "Remote",
     "Protocol",
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module_path = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(module_path)
+
+    if module_path.rsplit(".", 1)[-1] == name:
+        value = module
+    else:
+        value = getattr(module, name)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
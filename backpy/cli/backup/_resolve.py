@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from backpy.cli.elements import _UUID_RE, print_error_message
+from backpy.core.utils.exceptions import InvalidBackupError, InvalidBackupSpaceError
+
+if TYPE_CHECKING:
+    from backpy import Backup, BackupSpace
+
+
+def resolve_space(identifier: str, debug: bool) -> "BackupSpace | None":
+    from backpy import BackupSpace
+
+    try:
+        if _UUID_RE.match(identifier):
+            space = BackupSpace.load_by_uuid(identifier)
+        else:
+            space = BackupSpace.load_by_name(identifier)
+    except InvalidBackupSpaceError:
+        print_error_message(
+            InvalidBackupSpaceError("There is no Backup Space with that name or UUID!"),
+            debug=debug,
+        )
+        return None
+
+    return space.get_as_child_class()
+
+
+def _match_backup(
+    space: "BackupSpace",
+    backups: "list[Backup]",
+    identifier: str,
+    verbosity_level: int,
+    debug: bool,
+) -> "Backup | None":
+    from backpy import Backup
+
+    match identifier:
+        case "oldest":
+            return backups[-1]
+        case "newest":
+            return backups[0]
+        case "largest":
+            return max(
+                backups,
+                key=lambda b: b.get_file_size(verbosity_level=verbosity_level),
+            )
+        case "smallest":
+            return min(
+                backups,
+                key=lambda b: b.get_file_size(verbosity_level=verbosity_level),
+            )
+        case _:
+            # Identifiers that cannot be a UUID (e.g. a mistyped keyword)
+            # fail here without attempting a filesystem lookup.
+            if _UUID_RE.match(identifier):
+                try:
+                    return Backup.load_by_uuid(
+                        backup_space=space,
+                        unique_id=identifier,
+                        verbosity_level=verbosity_level,
+                    )
+                except Exception:
+                    pass
+
+            print_error_message(
+                InvalidBackupError(
+                    f"There is no Backup with that UUID in the Backup "
+                    f"Space '{space.get_name()}'"
+                ),
+                debug=debug,
+            )
+            return None
+
+
+def resolve_space_and_backups(
+    space_identifier: str,
+    backup_identifiers: "tuple[str, ...]",
+    verbosity_level: int,
+    debug: bool,
+) -> "tuple[BackupSpace, list[Backup]] | None":
+    space = resolve_space(space_identifier, debug=debug)
+
+    if space is None:
+        return None
+
+    # Fetched once (newest first) so the emptiness check and the keyword
+    # lookups below do not re-scan the Backup Space per access.
+    backups = space.get_backups(sort_by="date", check_hash=False)
+
+    if len(backups) == 0:
+        print_error_message(
+            InvalidBackupError("There is no Backup present in this Backup Space!"),
+            debug=debug,
+        )
+        return None
+
+    resolved = []
+    seen = set()
+
+    for identifier in backup_identifiers:
+        backup = _match_backup(
+            space, backups, identifier, verbosity_level=verbosity_level, debug=debug
+        )
+
+        if backup is None:
+            return None
+
+        # Identifiers may alias the same backup (e.g. 'newest' twice or
+        # a keyword next to its UUID); acting on it twice would fail.
+        if backup.get_uuid() in seen:
+            continue
+
+        seen.add(backup.get_uuid())
+        resolved.append(backup)
+
+    return space, resolved
+
+
+def resolve_space_and_backup(
+    space_identifier: str,
+    backup_identifier: str,
+    verbosity_level: int,
+    debug: bool,
+) -> "tuple[BackupSpace, Backup] | None":
+    resolved = resolve_space_and_backups(
+        space_identifier,
+        (backup_identifier,),
+        verbosity_level=verbosity_level,
+        debug=debug,
+    )
+
+    if resolved is None:
+        return None
+
+    space, backups = resolved
+
+    return space, backups[0]
@@ -1,6 +1,5 @@
 import rich_click as click
 
-from backpy import BackupSpace
 from backpy.cli.colors import RESET, get_default_palette
 from backpy.cli.elements import (
     BackupSpaceInput,
@@ -16,6 +15,42 @@ from backpy.core.utils.exceptions import (
 
 palette = get_default_palette()
 
+_LOCATIONS = frozenset(("all", "local", "remote"))
+
+
+def _validate_location(value: str) -> bool:
+    return value in _LOCATIONS
+
+
+# Prompt strings are static apart from user values, so the escape-code
+# interpolation is done once at import time instead of per prompt.
+_LOCATION_PROMPT = (
+    f"{palette.base}> Enter at which {palette.lavender}locations{palette.base} "
+    f"the backup should be saved (options: 'all', 'remote', 'local'):{RESET}"
+)
+_LOCATION_INVALID_MESSAGE = (
+    f"{palette.maroon}The given value is not one of the options "
+    f"{palette.red}('all', 'remote', 'local'). "
+    f"{palette.maroon}Please try again.{RESET}"
+)
+_COMMENT_PROMPT = (
+    f"{palette.base}> Enter a {palette.lavender}custom comment{palette.base} "
+    f"(can be empty):{RESET}"
+)
+_INCLUDE_PROMPT = (
+    f"{palette.base}> Enter a comma-seperated enumeration of {palette.lavender}"
+    f"elements that should be {palette.maroon}included{palette.lavender} in the "
+    f"backup{palette.base} "
+    f"(e.g. paths, patterns, tables, databases) (if empty every non-excluded element "
+    f"will be used):{RESET}"
+)
+_EXCLUDE_PROMPT = (
+    f"{palette.base}> Enter a comma-seperated enumeration of {palette.lavender}"
+    f"elements that should be {palette.maroon}excluded{palette.lavender} from the "
+    f"backup{palette.base} "
+    f"(e.g. paths, patterns, tables, databases) (can be empty):{RESET}"
+)
+
 
 def create_interactive(verbosity_level: int) -> None:
 
@@ -27,46 +62,34 @@ def create_interactive(verbosity_level: int) -> None:
             "Delete a backup or raise the limit."
         )
 
-    def _validate_location(value: str):
-        return value in ["all", "local", "remote"]
-
     if space.get_remote():
         location = TextInput(
-            message=f"{palette.base}> Enter at which {palette.lavender}locations{palette.base} "
-            f"the backup should be saved (options: 'all', 'remote', 'local'):{RESET}",
+            message=_LOCATION_PROMPT,
             validate=_validate_location,
             default_value="all",
-            invalid_error_message=f"{palette.maroon}The given value is not one of the options "
-            f"{palette.red}('all', 'remote', 'local'). "
-            f"{palette.maroon}Please try again.{RESET}",
+            invalid_error_message=_LOCATION_INVALID_MESSAGE,
         ).prompt()
     else:
         location = "all"
 
     comment = TextInput(
-        message=f"{palette.base}> Enter a {palette.lavender}custom comment{palette.base} "
-        f"(can be empty):{RESET}",
+        message=_COMMENT_PROMPT,
         default_value="",
     ).prompt()
 
-    if space.get_type().use_inclusion:
+    space_type = space.get_type()
+
+    if space_type.use_inclusion:
         include = EnumerationInput(
-            message=f"{palette.base}> Enter a comma-seperated enumeration of {palette.lavender}"
-            f"elements that should be {palette.maroon}included{palette.lavender} in the "
-            f"backup{palette.base} "
-            f"(e.g. paths, patterns, tables, databases) (if empty every non-excluded element "
-            f"will be used):{RESET}",
+            message=_INCLUDE_PROMPT,
             default_value="",
         ).prompt()
     else:
         include = []
 
-    if space.get_type().use_exclusion:
+    if space_type.use_exclusion:
         exclude = EnumerationInput(
-            message=f"{palette.base}> Enter a comma-seperated enumeration of {palette.lavender}"
-            f"elements that should be {palette.maroon}excluded{palette.lavender} from the "
-            f"backup{palette.base} "
-            f"(e.g. paths, patterns, tables, databases) (can be empty):{RESET}",
+            message=_EXCLUDE_PROMPT,
             default_value="",
         ).prompt()
     else:
@@ -89,8 +112,8 @@ def create_interactive(verbosity_level: int) -> None:
 
 @click.command(
     "create",
-    help=f"Create a new backup for a {palette.sky}'BACKUP_SPACE'{RESET} "
-    f"identified by its UUID or name.",
+    help="Create a new backup for a [cyan]'BACKUP_SPACE'[/] "
+    "identified by its UUID or name.",
 )
 @click.argument("backup_space", type=str, default=None, required=False)
 @click.option(
@@ -164,6 +187,8 @@ def create(
 
     verbose += 1
 
+    from backpy.cli.backup._resolve import resolve_space
+
     if interactive:
         return create_interactive(verbosity_level=verbose)
 
@@ -176,20 +201,10 @@ def create(
             debug=debug,
         )
 
-    try:
-        space = BackupSpace.load_by_uuid(backup_space)
-    except Exception:
-        try:
-            space = BackupSpace.load_by_name(backup_space)
-        except Exception:
-            return print_error_message(
-                InvalidBackupSpaceError(
-                    "There is no Backup Space with that name or UUID!"
-                ),
-                debug=debug,
-            )
+    space = resolve_space(backup_space, debug=debug)
 
-    space = space.get_as_child_class()
+    if space is None:
+        return None
 
     if space.is_backup_limit_reached():
         if space.is_auto_deletion_active():
@@ -203,16 +218,18 @@ def create(
                 debug=debug,
             )
 
-    if not space.get_type().use_exclusion and exclude is not None:
+    space_type = space.get_type()
+
+    if not space_type.use_exclusion and exclude is not None:
         print(
-            f"{palette.yellow}The Backup Space type {space.get_type().name} "
+            f"{palette.yellow}The Backup Space type {space_type.name} "
             "does not use exclusions. "
             "The parameter has therefore no effect."
         )
 
-    if not space.get_type().use_inclusion and include is not None:
+    if not space_type.use_inclusion and include is not None:
         print(
-            f"{palette.yellow}The Backup Space type {space.get_type().name} "
+            f"{palette.yellow}The Backup Space type {space_type.name} "
             "does not use inclusions. "
             f"The parameter has therefore no effect."
         )
@@ -1,7 +1,5 @@
 import rich_click as click
-from rich.console import Console
 
-from backpy import Backup, BackupSpace
 from backpy.cli.colors import RESET, get_default_palette
 from backpy.cli.elements import (
     BackupInput,
@@ -9,7 +7,7 @@ from backpy.cli.elements import (
     ConfirmInput,
     print_error_message,
 )
-from backpy.core.utils.exceptions import InvalidBackupError, InvalidBackupSpaceError
+from backpy.core.utils.exceptions import InvalidBackupError
 
 palette = get_default_palette()
 
@@ -48,12 +46,12 @@ def delete_interactive(force: bool, debug: bool, verbosity_level: int):
 
 @click.command(
     "delete",
-    help=f"Delete a {palette.sky}'BACKUP'{RESET} identified by its UUID or a "
-    f"keyword ('latest', 'oldest' or 'largest', 'smallest') "
-    f"from a {palette.sky}'BACKUP_SPACE'{RESET} identified by its UUID or name.",
+    help="Delete one or more [cyan]'BACKUPS'[/] identified by their UUIDs or a "
+    "keyword ('latest', 'oldest' or 'largest', 'smallest') "
+    "from a [cyan]'BACKUP_SPACE'[/] identified by its UUID or name.",
 )
 @click.argument("backup_space", type=str, default=None, required=False)
-@click.argument("backup", type=str, default=None, required=False)
+@click.argument("backups", type=str, nargs=-1)
 @click.option(
     "--force",
     "-f",
@@ -78,7 +76,7 @@ def delete_interactive(force: bool, debug: bool, verbosity_level: int):
 )
 def delete(
     backup_space: str | None,
-    backup: str | None,
+    backups: tuple[str, ...],
     force: bool,
     verbose: int,
     debug: bool,
@@ -86,78 +84,58 @@ def delete(
 ) -> None:
     verbose += 1
 
+    from backpy.cli.backup._resolve import resolve_space_and_backups
+    from backpy.cli.console import get_console
+
     if interactive:
         return delete_interactive(force=force, debug=debug, verbosity_level=verbose)
 
-    if backup_space is None or backup is None:
+    if backup_space is None or len(backups) == 0:
         return print_error_message(
             ValueError(
                 "If the '--interactive' flag is not given, you have to supply "
-                "a valid value for the 'BACKUP_SPACE' and 'BACKUP' arguments."
+                "a valid value for the 'BACKUP_SPACE' and 'BACKUPS' arguments."
             ),
             debug=debug,
         )
 
-    try:
-        space = BackupSpace.load_by_uuid(backup_space)
-    except Exception:
-        try:
-            space = BackupSpace.load_by_name(backup_space)
-        except Exception:
-            return print_error_message(
-                InvalidBackupSpaceError(
-                    "There is no Backup Space with that name or UUID!"
-                ),
-                debug=debug,
-            )
+    # The Backup Space is loaded once and shared by all given backups, so
+    # bulk deletions do not pay the metadata-read cost per backup.
+    resolved = resolve_space_and_backups(
+        backup_space, backups, verbosity_level=verbose, debug=debug
+    )
 
-    space = space.get_as_child_class()
+    if resolved is None:
+        return None
 
-    if len(space.get_backups(check_hash=False)) == 0:
-        return print_error_message(
-            InvalidBackupError("There is no Backup present in this Backup Space!"),
-            debug=debug,
-        )
+    _, backups = resolved
 
-    match backup:
-        case "oldest":
-            backup = space.get_backups(sort_by="date", check_hash=False)[-1]
-        case "newest":
-            backup = space.get_backups(sort_by="date", check_hash=False)[0]
-        case "largest":
-            backup = space.get_backups(sort_by="size", check_hash=False)[0]
-        case "smallest":
-            backup = space.get_backups(sort_by="size", check_hash=False)[-1]
-        case _:
-            try:
-                backup = Backup.load_by_uuid(
-                    backup_space=space, unique_id=backup, verbosity_level=verbose
-                )
-            except Exception:
-                return print_error_message(
-                    InvalidBackupError(
-                        f"There is no Backup with that UUID in the Backup "
-                        f"Space '{space.get_name()}'"
-                    ),
-                    debug=debug,
-                )
+    for backup in backups:
+        get_console().print(backup.get_info_table())
+
+    if len(backups) == 1:
+        subject = f"backup {palette.maroon}{str(backups[0].get_uuid())}{palette.base}"
+    else:
+        subject = f"these {palette.maroon}{len(backups)}{palette.base} backups"
 
-    Console().print(backup.get_info_table())
     if not force:
         confirm = ConfirmInput(
-            message=f"{palette.base}Are you sure you want to delete backup "
-            f"{palette.maroon}{str(backup.get_uuid())}{palette.base}?{RESET}",
+            message=f"{palette.base}Are you sure you want to delete "
+            f"{subject}?{RESET}",
             default_value=False,
         ).prompt()
 
         if confirm:
-            backup.delete(verbosity_level=verbose)
+            for backup in backups:
+                backup.delete(verbosity_level=verbose)
         else:
-            print(
-                f"{palette.red}Canceled removal of backup "
-                f"{palette.maroon}{str(backup.get_uuid())}{palette.red}.{RESET}"
-            )
+            for backup in backups:
+                print(
+                    f"{palette.red}Canceled removal of backup "
+                    f"{palette.maroon}{str(backup.get_uuid())}{palette.red}.{RESET}"
+                )
     else:
-        backup.delete(verbosity_level=verbose)
+        for backup in backups:
+            backup.delete(verbosity_level=verbose)
 
     return None
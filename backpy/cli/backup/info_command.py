@@ -1,7 +1,5 @@
 import rich_click as click
-from rich.console import Console
 
-from backpy import Backup, BackupSpace
 from backpy.cli.colors import RESET, get_default_palette
 from backpy.cli.elements import (
     BackupInput,
@@ -9,12 +7,14 @@ from backpy.cli.elements import (
     ConfirmInput,
     print_error_message,
 )
-from backpy.core.utils.exceptions import InvalidBackupError, InvalidBackupSpaceError
+from backpy.core.utils.exceptions import InvalidBackupError
 
 palette = get_default_palette()
 
 
 def info_interactive(verbosity_level: int, debug: bool):
+    from backpy.cli.console import get_console
+
     space = BackupSpaceInput(suggest_matches=True).prompt()
 
     if len(space.get_backups(check_hash=False)) == 0:
@@ -33,7 +33,7 @@ def info_interactive(verbosity_level: int, debug: bool):
         default_value=True,
     ).prompt()
 
-    Console().print(
+    get_console().print(
         backup.get_info_table(check_hash=check_hash, verbosity_level=verbosity_level)
     )
 
@@ -42,9 +42,9 @@ def info_interactive(verbosity_level: int, debug: bool):
 
 @click.command(
     "info",
-    help=f"Get info about a {palette.sky}'BACKUP'{RESET} identified by its UUID or a "
-    f"keyword ('latest', 'oldest' or 'largest', 'smallest') "
-    f"from a {palette.sky}'BACKUP_SPACE'{RESET} identified by its UUID or name.",
+    help="Get info about a [cyan]'BACKUP'[/] identified by its UUID or a "
+    "keyword ('latest', 'oldest' or 'largest', 'smallest') "
+    "from a [cyan]'BACKUP_SPACE'[/] identified by its UUID or name.",
 )
 @click.argument("backup_space", type=str, default=None, required=False)
 @click.argument("backup", type=str, default=None, required=False)
@@ -83,6 +83,9 @@ def info(
 
     verbose += 1
 
+    from backpy.cli.backup._resolve import resolve_space_and_backup
+    from backpy.cli.console import get_console
+
     if interactive:
         return info_interactive(verbosity_level=verbose, debug=debug)
 
@@ -95,59 +98,24 @@ def info(
             debug=debug,
         )
 
-    try:
-        space = BackupSpace.load_by_uuid(backup_space)
-    except Exception:
-        try:
-            space = BackupSpace.load_by_name(backup_space)
-        except Exception:
-            return print_error_message(
-                InvalidBackupSpaceError(
-                    "There is no Backup Space with that name or UUID!"
-                ),
-                debug=debug,
-            )
-
-    space = space.get_as_child_class()
+    resolved = resolve_space_and_backup(
+        backup_space, backup, verbosity_level=verbose, debug=debug
+    )
 
-    if len(space.get_backups(check_hash=False)) == 0:
-        return print_error_message(
-            InvalidBackupError("There is no Backup present in this Backup Space!"),
-            debug=debug,
-        )
+    if resolved is None:
+        return None
 
-    match backup:
-        case "oldest":
-            backup = space.get_backups(sort_by="date", check_hash=False)[-1]
-        case "newest":
-            backup = space.get_backups(sort_by="date", check_hash=False)[0]
-        case "largest":
-            backup = space.get_backups(sort_by="size", check_hash=False)[0]
-        case "smallest":
-            backup = space.get_backups(sort_by="size", check_hash=False)[-1]
-        case _:
-            try:
-                backup = Backup.load_by_uuid(
-                    backup_space=space, unique_id=backup, verbosity_level=verbose
-                )
-            except Exception:
-                return print_error_message(
-                    InvalidBackupError(
-                        f"There is no Backup with that UUID in the Backup Space "
-                        f"'{space.get_name()}'"
-                    ),
-                    debug=debug,
-                )
+    _, backup = resolved
 
     remote = backup.get_remote()
 
     if remote is not None:
         with remote(context_verbosity=verbose, debug=debug):
-            Console().print(
+            get_console().print(
                 backup.get_info_table(check_hash=check_hash, verbosity_level=verbose)
             )
     else:
-        Console().print(
+        get_console().print(
             backup.get_info_table(check_hash=check_hash, verbosity_level=verbose)
         )
 
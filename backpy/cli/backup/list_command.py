@@ -1,20 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import rich_click as click
-from rich.console import Console
-from rich.tree import Tree
 
-from backpy import BackupSpace
 from backpy.cli.colors import RESET, get_default_palette
 from backpy.cli.elements import print_error_message
 from backpy.core.utils import bytes2str
-from backpy.core.utils.exceptions import InvalidBackupSpaceError
 
 palette = get_default_palette()
 
 
 @click.command(
     "list",
-    help=f"List all backups in a {palette.sky}'BACKUP_SPACE'{RESET} "
-    f"identified by its UUID or name.",
+    help="List all backups in a [cyan]'BACKUP_SPACE'[/] "
+    "identified by its UUID or name.",
 )
 @click.argument("backup_space", type=str, default=None, required=True)
 @click.option(
@@ -57,20 +55,16 @@ def list_backups(
 
     verbose += 1
 
-    try:
-        space = BackupSpace.load_by_uuid(backup_space)
-    except Exception:
-        try:
-            space = BackupSpace.load_by_name(backup_space)
-        except Exception:
-            return print_error_message(
-                InvalidBackupSpaceError(
-                    "There is no Backup Space with that name or UUID!"
-                ),
-                debug=debug,
-            )
+    from rich.live import Live
+    from rich.tree import Tree
+
+    from backpy.cli.backup._resolve import resolve_space
+    from backpy.cli.console import get_console
+
+    space = resolve_space(backup_space, debug=debug)
 
-    space = space.get_as_child_class()
+    if space is None:
+        return None
 
     tree = Tree(
         f"{palette.mauve}Backups in {palette.lavender}{space.get_name()} (UUID: {space.get_uuid()})"
@@ -83,33 +77,17 @@ def list_backups(
         return print_error_message(error=e, debug=debug)
 
     def _generate_tree():
+        hash_branches = {}
+
         for backup in backups:
             backup_branch = tree.add(
                 f"{palette.sky}{'🔒 ' if backup.is_locked() else '🔓 '}{backup.get_uuid()}{RESET}",
             )
 
             if check_hash:
-                hash_branch = backup_branch.add(f"{palette.lavender}Hash Check{RESET}")
-                if backup.has_local_archive():
-                    local_check = (
-                        f"{palette.green}passed{RESET}"
-                        if backup.check_hash(remote=False, verbosity_level=verbose)
-                        else "failed"
-                    )
-                    hash_branch.add(
-                        f"{palette.lavender}Local: {palette.maroon}"
-                        f"{local_check}{RESET}"
-                    )
-                if backup.has_remote_archive() is not None:
-                    remote_check = (
-                        f"{palette.green}passed{RESET}"
-                        if backup.check_hash(remote=True, verbosity_level=verbose)
-                        else "failed"
-                    )
-                    hash_branch.add(
-                        f"{palette.lavender}Remote: {palette.maroon}"
-                        f"{remote_check}{RESET}"
-                    )
+                hash_branches[backup.get_uuid()] = backup_branch.add(
+                    f"{palette.lavender}Hash Check{RESET}"
+                )
 
             if depth > 1:
                 backup_branch.add(
@@ -135,13 +113,66 @@ def list_backups(
                     f"{palette.lavender}Comment: {palette.maroon}{comment}{RESET}"
                 )
 
-    remote = space.get_remote()
-    if remote is not None:
-        with remote(context_verbosity=verbose, debug=debug):
+        if check_hash:
+            local_jobs = [b for b in backups if b.has_local_archive()]
+
+            # Local SHA256 checks are independent and IO-bound, so they run
+            # in a thread pool and are added to the tree as they complete.
+            # Remote checks share one SSH session and therefore stay
+            # sequential in the loop below.
+            if len(local_jobs) > 0:
+                with ThreadPoolExecutor(
+                    max_workers=min(8, len(local_jobs))
+                ) as executor:
+                    futures = {
+                        executor.submit(
+                            b.check_hash, remote=False, verbosity_level=verbose
+                        ): b
+                        for b in local_jobs
+                    }
+                    for future in as_completed(futures):
+                        local_check = (
+                            f"{palette.green}passed{RESET}"
+                            if future.result()
+                            else "failed"
+                        )
+                        hash_branches[futures[future].get_uuid()].add(
+                            f"{palette.lavender}Local: {palette.maroon}"
+                            f"{local_check}{RESET}"
+                        )
+
+            for backup in backups:
+                if backup.has_remote_archive() is not None:
+                    remote_check = (
+                        f"{palette.green}passed{RESET}"
+                        if backup.check_hash(remote=True, verbosity_level=verbose)
+                        else "failed"
+                    )
+                    hash_branches[backup.get_uuid()].add(
+                        f"{palette.lavender}Remote: {palette.maroon}"
+                        f"{remote_check}{RESET}"
+                    )
+
+    def _run():
+        remote = space.get_remote()
+        if remote is not None:
+            with remote(context_verbosity=verbose, debug=debug):
+                _generate_tree()
+        else:
             _generate_tree()
-    else:
-        _generate_tree()
 
-    Console().print(tree)
+    console = get_console()
+
+    if console.is_terminal:
+        # Renders the partially built tree every refresh, so the backup
+        # list appears immediately and hash results stream in instead of
+        # showing nothing until every check has finished.
+        with Live(tree, console=console, refresh_per_second=4):
+            _run()
+    else:
+        # Piped output gets the finished tree in one go, keeping the
+        # output stable for tools like grep.
+        _run()
+        console.print(tree)
 
     return None
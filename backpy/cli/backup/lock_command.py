@@ -1,18 +1,24 @@
 import rich_click as click
-from rich.console import Console
 
-from backpy import Backup, BackupSpace
 from backpy.cli.colors import RESET, get_default_palette
+from backpy.cli.console import get_console
 from backpy.cli.elements import (
     BackupInput,
     BackupSpaceInput,
     ConfirmInput,
     print_error_message,
 )
-from backpy.core.utils.exceptions import InvalidBackupError, InvalidBackupSpaceError
+from backpy.core.utils.exceptions import InvalidBackupError
 
 palette = get_default_palette()
 
+# Static fragments of the repeated messages are rendered once at import
+# time; only the backup UUID is interpolated per call.
+_CONFIRM_PREFIX = f"{palette.base}Are you sure you want to lock backup {palette.maroon}"
+_CONFIRM_SUFFIX = f"{palette.base}?{RESET}"
+_CANCEL_PREFIX = f"{palette.red}Canceled locking of backup {palette.maroon}"
+_CANCEL_SUFFIX = f"{palette.red}.{RESET}"
+
 
 def lock_interactive(force: bool, debug: bool, verbosity_level: int):
 
@@ -31,21 +37,17 @@ def lock_interactive(force: bool, debug: bool, verbosity_level: int):
             error=ValueError("This backup is already locked!"), debug=debug
         )
 
-    Console().print(backup.get_info_table(verbosity_level=verbosity_level))
+    get_console().print(backup.get_info_table(verbosity_level=verbosity_level))
     if not force:
         confirm = ConfirmInput(
-            message=f"{palette.base}Are you sure you want to lock backup "
-            f"{palette.maroon}{str(backup.get_uuid())}{palette.base}?{RESET}",
+            message=f"{_CONFIRM_PREFIX}{str(backup.get_uuid())}{_CONFIRM_SUFFIX}",
             default_value=False,
         ).prompt()
 
         if confirm:
             backup.lock(verbosity_level=verbosity_level)
         else:
-            print(
-                f"{palette.red}Canceled locking of backup "
-                f"{palette.maroon}{str(backup.get_uuid())}{palette.red}.{RESET}"
-            )
+            print(f"{_CANCEL_PREFIX}{str(backup.get_uuid())}{_CANCEL_SUFFIX}")
     else:
         backup.lock(verbosity_level=verbosity_level)
 
@@ -54,10 +56,10 @@ def lock_interactive(force: bool, debug: bool, verbosity_level: int):
 
 @click.command(
     "lock",
-    help=f"Lock a {palette.sky}'BACKUP'{RESET} identified by its UUID or a "
-    f"keyword ('latest', 'oldest' or 'largest', 'smallest') "
-    f"from a {palette.sky}'BACKUP_SPACE'{RESET} identified by its UUID or name. "
-    f"A locked backup cannot be deleted automatically (e.g. if the backup space is full).",
+    help="Lock a [cyan]'BACKUP'[/] identified by its UUID or a "
+    "keyword ('latest', 'oldest' or 'largest', 'smallest') "
+    "from a [cyan]'BACKUP_SPACE'[/] identified by its UUID or name. "
+    "A locked backup cannot be deleted automatically (e.g. if the backup space is full).",
 )
 @click.argument("backup_space", type=str, default=None, required=False)
 @click.argument("backup", type=str, default=None, required=False)
@@ -93,6 +95,8 @@ def lock(
 ) -> None:
     verbose += 1
 
+    from backpy.cli.backup._resolve import resolve_space_and_backup
+
     if interactive:
         return lock_interactive(force=force, debug=debug, verbosity_level=verbose)
 
@@ -105,70 +109,31 @@ def lock(
             debug=debug,
         )
 
-    try:
-        space = BackupSpace.load_by_uuid(backup_space)
-    except Exception:
-        try:
-            space = BackupSpace.load_by_name(backup_space)
-        except Exception:
-            return print_error_message(
-                InvalidBackupSpaceError(
-                    "There is no Backup Space with that name or UUID!"
-                ),
-                debug=debug,
-            )
-
-    space = space.get_as_child_class()
+    resolved = resolve_space_and_backup(
+        backup_space, backup, verbosity_level=verbose, debug=debug
+    )
 
-    if len(space.get_backups(check_hash=False)) == 0:
-        return print_error_message(
-            InvalidBackupError("There is no Backup present in this Backup Space!"),
-            debug=debug,
-        )
+    if resolved is None:
+        return None
 
-    match backup:
-        case "oldest":
-            backup = space.get_backups(sort_by="date", check_hash=False)[-1]
-        case "newest":
-            backup = space.get_backups(sort_by="date", check_hash=False)[0]
-        case "largest":
-            backup = space.get_backups(sort_by="size", check_hash=False)[0]
-        case "smallest":
-            backup = space.get_backups(sort_by="size", check_hash=False)[-1]
-        case _:
-            try:
-                backup = Backup.load_by_uuid(
-                    backup_space=space, unique_id=backup, verbosity_level=verbose
-                )
-            except Exception:
-                return print_error_message(
-                    InvalidBackupError(
-                        f"There is no Backup with that UUID in the Backup "
-                        f"Space '{space.get_name()}'"
-                    ),
-                    debug=debug,
-                )
+    _, backup = resolved
 
     if backup.is_locked():
         return print_error_message(
             error=ValueError("This backup is already locked!"), debug=debug
         )
 
-    Console().print(backup.get_info_table(verbosity_level=verbose))
+    get_console().print(backup.get_info_table(verbosity_level=verbose))
     if not force:
         confirm = ConfirmInput(
-            message=f"{palette.base}Are you sure you want to lock backup "
-            f"{palette.maroon}{str(backup.get_uuid())}{palette.base}?{RESET}",
+            message=f"{_CONFIRM_PREFIX}{str(backup.get_uuid())}{_CONFIRM_SUFFIX}",
             default_value=False,
         ).prompt()
 
         if confirm:
             backup.lock(verbosity_level=verbose)
         else:
-            print(
-                f"{palette.red}Canceled locking of backup "
-                f"{palette.maroon}{str(backup.get_uuid())}{palette.red}.{RESET}"
-            )
+            print(f"{_CANCEL_PREFIX}{str(backup.get_uuid())}{_CANCEL_SUFFIX}")
     else:
         backup.lock(verbosity_level=verbose)
 
@@ -1,7 +1,5 @@
 import rich_click as click
-from rich.console import Console
 
-from backpy import Backup, BackupSpace
 from backpy.cli.colors import RESET, get_default_palette
 from backpy.cli.elements import (
     BackupInput,
@@ -12,14 +10,38 @@ from backpy.cli.elements import (
 )
 from backpy.core.utils.exceptions import (
     InvalidBackupError,
-    InvalidBackupSpaceError,
     InvalidChecksumError,
 )
 
 palette = get_default_palette()
 
+# Static fragments of the repeated messages are rendered once at import
+# time; only the backup UUID is interpolated per call.
+_CONFIRM_PREFIX = (
+    f"{palette.base}Are you sure you want to restore backup {palette.maroon}"
+)
+_CONFIRM_SUFFIX = f"{palette.base}?{RESET}"
+_CANCEL_PREFIX = f"{palette.red}Canceled restoring of backup {palette.maroon}"
+_CANCEL_SUFFIX = f"{palette.red}.{RESET}"
+_RESTORE_MODE_PREFIX = f"{palette.base}Restore mode: {palette.maroon}"
+
+# Prompt strings are static apart from user values, so the escape-code
+# interpolation is done once at import time instead of per prompt.
+_SOURCE_PROMPT = (
+    f"{palette.base}> From where do you want to restore to the backup file? "
+    f"('local' or 'remote') {RESET}"
+)
+_INCREMENTAL_PROMPT = (
+    f"{palette.base}> Do you want to restore the backup incrementally? "
+    "This means that only content, which is included in the backup "
+    "will be affected. If not, the contents will be deleted and replaced "
+    f"by the backed up content.{RESET}"
+)
+
 
 def restore_interactive(force: bool, debug: bool, verbosity_level: int):
+    from backpy.cli.console import get_console
+
     space = BackupSpaceInput(suggest_matches=True).prompt()
 
     if len(space.get_backups(check_hash=False)) == 0:
@@ -32,8 +54,7 @@ def restore_interactive(force: bool, debug: bool, verbosity_level: int):
 
     if backup.has_remote_archive() and backup.has_local_archive():
         source = TextInput(
-            message=f"{palette.base}> From where do you want to restore to the backup file? "
-            f"('local' or 'remote') {RESET}",
+            message=_SOURCE_PROMPT,
             suggest_matches=True,
             suggestible_values=["local", "remote"],
             default_value="local" if backup.has_local_archive() else "remote",
@@ -44,24 +65,20 @@ def restore_interactive(force: bool, debug: bool, verbosity_level: int):
         source = "local"
 
     incremental = ConfirmInput(
-        message=f"{palette.base}> Do you want to restore the backup incrementally? "
-        "This means that only content, which is included in the backup "
-        "will be affected. If not, the contents will be deleted and replaced "
-        f"by the backed up content.{RESET}",
+        message=_INCREMENTAL_PROMPT,
         default_value=True,
     ).prompt()
 
-    Console().print(backup.get_info_table())
+    get_console().print(backup.get_info_table())
     print(
-        f"{palette.base}Restore mode: "
-        f"{palette.maroon}{'incremental' if incremental else 'non-incremental'}{RESET}"
+        f"{_RESTORE_MODE_PREFIX}"
+        f"{'incremental' if incremental else 'non-incremental'}{RESET}"
     )
 
     if not force:
 
         confirm = ConfirmInput(
-            message=f"{palette.base}Are you sure you want to restore backup "
-            f"{palette.maroon}{str(backup.get_uuid())}{palette.base}?{RESET}",
+            message=f"{_CONFIRM_PREFIX}{str(backup.get_uuid())}{_CONFIRM_SUFFIX}",
             default_value=False,
         ).prompt()
 
@@ -79,10 +96,7 @@ def restore_interactive(force: bool, debug: bool, verbosity_level: int):
                     debug=debug,
                 )
         else:
-            print(
-                f"{palette.red}Canceled restoring of backup "
-                f"{palette.maroon}{str(backup.get_uuid())}{palette.red}.{RESET}"
-            )
+            print(f"{_CANCEL_PREFIX}{str(backup.get_uuid())}{_CANCEL_SUFFIX}")
     else:
         backup.restore(
             incremental=incremental, source=source, verbosity_level=verbosity_level
@@ -93,12 +107,12 @@ def restore_interactive(force: bool, debug: bool, verbosity_level: int):
 
 @click.command(
     "restore",
-    help=f"Restore a {palette.sky}'BACKUP'{RESET} identified by its UUID or a "
-    f"keyword ('latest', 'oldest' or 'largest', 'smallest') "
-    f"to a {palette.sky}'BACKUP_SPACE'{RESET} identified by its UUID or name.",
+    help="Restore one or more [cyan]'BACKUPS'[/] identified by their UUIDs or a "
+    "keyword ('latest', 'oldest' or 'largest', 'smallest') "
+    "to a [cyan]'BACKUP_SPACE'[/] identified by its UUID or name.",
 )
 @click.argument("backup_space", type=str, default=None, required=False)
-@click.argument("backup", type=str, default=None, required=False)
+@click.argument("backups", type=str, nargs=-1)
 @click.option(
     "--incremental",
     type=bool,
@@ -139,7 +153,7 @@ def restore_interactive(force: bool, debug: bool, verbosity_level: int):
 )
 def restore(
     backup_space: str | None,
-    backup: str | None,
+    backups: tuple[str, ...],
     incremental: bool,
     source: str,
     force: bool,
@@ -149,111 +163,94 @@ def restore(
 ) -> None:
     verbose += 1
 
+    from backpy.cli.backup._resolve import resolve_space_and_backups
+    from backpy.cli.console import get_console
+
     if interactive:
         return restore_interactive(force=force, debug=debug, verbosity_level=verbose)
 
-    if backup_space is None or backup is None:
+    if backup_space is None or len(backups) == 0:
         return print_error_message(
             ValueError(
                 "If the '--interactive' flag is not given, you have to supply "
-                "a valid value for the 'BACKUP_SPACE' and 'BACKUP' arguments."
+                "a valid value for the 'BACKUP_SPACE' and 'BACKUPS' arguments."
             ),
             debug=debug,
         )
 
-    try:
-        space = BackupSpace.load_by_uuid(backup_space)
-    except Exception:
-        try:
-            space = BackupSpace.load_by_name(backup_space)
-        except Exception:
+    # The Backup Space is loaded once and shared by all given backups, so
+    # bulk restores do not pay the metadata-read cost per backup.
+    resolved = resolve_space_and_backups(
+        backup_space, backups, verbosity_level=verbose, debug=debug
+    )
+
+    if resolved is None:
+        return None
+
+    _, backups = resolved
+
+    for backup in backups:
+        if source == "remote" and not backup.has_remote_archive():
             return print_error_message(
-                InvalidBackupSpaceError(
-                    "There is no Backup Space with that name or UUID!"
+                InvalidBackupError(
+                    f"The backup '{backup.get_uuid()}' does not have a remote "
+                    f"backup file."
+                ),
+                debug=debug,
+            )
+        elif source == "local" and not backup.has_local_archive():
+            return print_error_message(
+                InvalidBackupError(
+                    f"The backup '{backup.get_uuid()}' does not have a local "
+                    f"backup file."
                 ),
                 debug=debug,
             )
 
-    space = space.get_as_child_class()
-
-    if len(space.get_backups(check_hash=False)) == 0:
-        return print_error_message(
-            InvalidBackupError("There is no Backup present in this Backup Space!"),
-            debug=debug,
-        )
-
-    match backup:
-        case "oldest":
-            backup = space.get_backups(sort_by="date", check_hash=False)[-1]
-        case "newest":
-            backup = space.get_backups(sort_by="date", check_hash=False)[0]
-        case "largest":
-            backup = space.get_backups(sort_by="size", check_hash=False)[0]
-        case "smallest":
-            backup = space.get_backups(sort_by="size", check_hash=False)[-1]
-        case _:
-            try:
-                backup = Backup.load_by_uuid(
-                    backup_space=space, unique_id=backup, verbosity_level=verbose
-                )
-            except Exception:
-                return print_error_message(
-                    InvalidBackupError(
-                        f"There is no Backup with that UUID in the Backup "
-                        f"Space '{space.get_name()}'"
-                    ),
-                    debug=debug,
-                )
-
-    if source == "remote" and not backup.has_remote_archive():
-        return print_error_message(
-            InvalidBackupError(
-                f"The backup '{backup.get_uuid()}' does not have a remote backup file."
-            ),
-            debug=debug,
-        )
-    elif source == "local" and not backup.has_local_archive():
-        return print_error_message(
-            InvalidBackupError(
-                f"The backup '{backup.get_uuid()}' does not have a local backup file."
-            ),
-            debug=debug,
-        )
+    for backup in backups:
+        get_console().print(backup.get_info_table())
 
-    Console().print(backup.get_info_table())
     print(
-        f"{palette.base}Restore mode: "
-        f"{palette.maroon}{'incremental' if incremental else 'non-incremental'}{RESET}"
+        f"{_RESTORE_MODE_PREFIX}"
+        f"{'incremental' if incremental else 'non-incremental'}{RESET}"
     )
 
+    if len(backups) == 1:
+        subject = f"backup {palette.maroon}{str(backups[0].get_uuid())}{palette.base}"
+    else:
+        subject = f"these {palette.maroon}{len(backups)}{palette.base} backups"
+
     if not force:
         confirm = ConfirmInput(
-            message=f"{palette.base}Are you sure you want to restore backup "
-            f"{palette.maroon}{str(backup.get_uuid())}{palette.base}?{RESET}",
+            message=f"{palette.base}Are you sure you want to restore "
+            f"{subject}?{RESET}",
             default_value=False,
         ).prompt()
 
         if confirm:
-            try:
-                backup.restore(
-                    incremental=incremental,
-                    source=source,
-                    force=force,
-                    verbosity_level=verbose,
-                )
-            except InvalidChecksumError as e:
-                print_error_message(
-                    error=e,
-                    debug=debug,
-                )
+            for backup in backups:
+                try:
+                    backup.restore(
+                        incremental=incremental,
+                        source=source,
+                        force=force,
+                        verbosity_level=verbose,
+                    )
+                except InvalidChecksumError as e:
+                    print_error_message(
+                        error=e,
+                        debug=debug,
+                    )
         else:
-            print(
-                f"{palette.red}Canceled restoring of backup "
-                f"{palette.maroon}{str(backup.get_uuid())}{palette.red}.{RESET}"
-            )
+            for backup in backups:
+                print(f"{_CANCEL_PREFIX}{str(backup.get_uuid())}{_CANCEL_SUFFIX}")
     else:
-        backup.restore(
-            incremental=incremental, source=source, force=force, verbosity_level=verbose
-        )
+        for backup in backups:
+            backup.restore(
+                incremental=incremental,
+                source=source,
+                force=force,
+                verbosity_level=verbose,
+            )
 
     return None
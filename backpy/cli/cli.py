@@ -1,19 +1,14 @@
+import functools
 import sys
 from datetime import datetime
 from pathlib import Path
 
 import rich_click as click
 
-import backpy
 import backpy.version
 from backpy import TOMLConfiguration, VariableLibrary
 from backpy.cli.colors import EFFECTS, RESET, get_default_palette
-
-from .backup import commands as backup
-from .config import commands as config
-from .remote import commands as remote
-from .schedule import commands as schedule
-from .space import commands as space
+from backpy.cli.lazy_group import LazyGroup
 
 palette = get_default_palette()
 
@@ -21,6 +16,9 @@ click.rich_click.THEME = (
     f"{VariableLibrary.get_variable('cli.rich.palette')}-"
     f"{VariableLibrary.get_variable('cli.rich.style')}"
 )
+# Help texts use Rich markup instead of raw ANSI palette escapes, so the
+# command modules do not have to build colored f-strings at import time.
+click.rich_click.USE_RICH_MARKUP = True
 
 
 def _print_version(ctx, param, value):
@@ -53,6 +51,7 @@ def _print_info(ctx, param, value):
     ctx.exit()
 
 
+@functools.cache
 def _create_epilog(short):
     pyproject = TOMLConfiguration(
         Path(backpy.__file__).parent.parent / "pyproject.toml"
@@ -93,9 +92,28 @@ def _create_epilog(short):
         )
 
 
+class _EntryPointGroup(LazyGroup):
+    # Building the epilog opens and parses pyproject.toml, so it is
+    # deferred until help is actually rendered instead of running at
+    # import time on every CLI invocation.
+    def format_help(self, ctx, formatter):
+        if self.epilog is None:
+            self.epilog = _create_epilog(short=True)
+        super().format_help(ctx, formatter)
+
+
 # Structure of the entry_point group and adding of the subcommands
 # taken from https://stackoverflow.com/a/39228156
-@click.group(epilog=_create_epilog(short=True))
+@click.group(
+    cls=_EntryPointGroup,
+    lazy_subcommands={
+        "space": "backpy.cli.space.commands:command",
+        "remote": "backpy.cli.remote.commands:command",
+        "backup": "backpy.cli.backup.commands:command",
+        "schedule": "backpy.cli.schedule.commands:command",
+        "config": "backpy.cli.config.commands:command",
+    },
+)
 @click.option(
     "--version",
     "-v",
@@ -115,12 +133,6 @@ def entry_point(**kwargs):
     pass
 
 
-entry_point.add_command(space.command)
-entry_point.add_command(remote.command)
-entry_point.add_command(backup.command)
-entry_point.add_command(schedule.command)
-entry_point.add_command(config.command)
-
 if __name__ == "__main__":
     if len(sys.argv) == 1:
         entry_point.main(["--help"])
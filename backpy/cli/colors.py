@@ -1,3 +1,4 @@
+import functools
 from enum import Enum
 
 from catppuccin.palette import PALETTE as _PALETTE
@@ -96,5 +97,8 @@ for effect in EFFECTS:
     effect.value.__get__ = _get_value
 
 
+# Cached so that every CLI module shares one palette lookup per process
+# instead of re-reading the configured palette name on each import.
+@functools.cache
 def get_default_palette():
     return PALETTE[VariableLibrary.get_variable("cli.color_palette")]
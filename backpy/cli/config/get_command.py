@@ -1,11 +1,10 @@
 import rich_click as click
-from fuzzyfinder import fuzzyfinder
 from rich.console import Console
 from rich.tree import Tree
 
 from backpy import VariableLibrary
 from backpy.cli.colors import EFFECTS, RESET, get_default_palette
-from backpy.cli.elements import print_error_message
+from backpy.cli.elements import get_suggestions, print_error_message
 from backpy.core.utils.exceptions import InvalidTOMLConfigurationError
 
 palette = get_default_palette()
@@ -13,7 +12,7 @@ palette = get_default_palette()
 
 @click.command(
     "get",
-    help=f"Get the value of a specific configuration variable by its {palette.sky}'KEY'{RESET}.",
+    help="Get the value of a specific configuration variable by its [cyan]'KEY'[/].",
 )
 @click.argument("key", type=str, required=True)
 @click.option(
@@ -24,8 +23,12 @@ palette = get_default_palette()
     "to print full error traces in case of a problem.",
 )
 def get_value(key: str, debug: bool) -> None:
+    # Bound once so the success and error paths share the same
+    # initialized singleton instead of re-resolving it per access.
+    config = VariableLibrary.get_config()
+
     try:
-        value = VariableLibrary.get_variable(key=key)
+        value = config[key]
     except InvalidTOMLConfigurationError:
         return print_error_message(
             error=InvalidTOMLConfigurationError(
@@ -35,13 +38,7 @@ def get_value(key: str, debug: bool) -> None:
             debug=debug,
         )
     except KeyError:
-        matched = list(
-            fuzzyfinder(
-                key,
-                VariableLibrary.get_config().get_keys(non_dict_only=True),
-                highlight=True,
-            )
-        )
+        matched = get_suggestions(key, config.get_keys(non_dict_only=True))
         return print_error_message(
             error=KeyError(
                 f"The variable '{key}' could not be found!\n"
@@ -1,11 +1,10 @@
 import rich_click as click
-from fuzzyfinder import fuzzyfinder
 from rich.console import Console
 from rich.tree import Tree
 
 from backpy import VariableLibrary
 from backpy.cli.colors import EFFECTS, RESET, get_default_palette
-from backpy.cli.elements import print_error_message
+from backpy.cli.elements import get_suggestions, print_error_message
 from backpy.core.utils.exceptions import InvalidTOMLConfigurationError
 
 palette = get_default_palette()
@@ -13,8 +12,8 @@ palette = get_default_palette()
 
 @click.command(
     "list",
-    help=f"List the values of the variable configuration. "
-    f"Given a {palette.sky}'KEY'{RESET}, a subtree of the configuration can be shown.",
+    help="List the values of the variable configuration. "
+    "Given a [cyan]'KEY'[/], a subtree of the configuration can be shown.",
 )
 @click.argument("key", type=str, default=None, required=False)
 @click.option(
@@ -25,11 +24,13 @@ palette = get_default_palette()
     "to print full error traces in case of a problem.",
 )
 def list_variables(key: str | None, debug: bool) -> None:
+    config = VariableLibrary.get_config()
+
     try:
         if key is None:
-            value = VariableLibrary.get_config().as_dict()
+            value = config.as_dict()
         else:
-            value = VariableLibrary.get_variable(key=key)
+            value = config[key]
     except InvalidTOMLConfigurationError:
         return print_error_message(
             error=InvalidTOMLConfigurationError(
@@ -39,9 +40,7 @@ def list_variables(key: str | None, debug: bool) -> None:
             debug=debug,
         )
     except KeyError:
-        matched = list(
-            fuzzyfinder(key, VariableLibrary.get_config().get_keys(), highlight=True)
-        )
+        matched = get_suggestions(key, config.get_keys())
         return print_error_message(
             error=KeyError(
                 f"The variable '{key}' could not be found!\n"
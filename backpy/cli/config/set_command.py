@@ -1,9 +1,8 @@
 import rich_click as click
-from fuzzyfinder import fuzzyfinder
 
 from backpy import VariableLibrary
 from backpy.cli.colors import EFFECTS, RESET, get_default_palette
-from backpy.cli.elements import ConfirmInput, print_error_message
+from backpy.cli.elements import ConfirmInput, get_suggestions, print_error_message
 from backpy.core.utils.exceptions import InvalidTOMLConfigurationError
 
 palette = get_default_palette()
@@ -11,8 +10,8 @@ palette = get_default_palette()
 
 @click.command(
     "set",
-    help=f"Set the {palette.sky}'VALUE'{RESET} of a specific "
-    f"configuration variable by its {palette.sky}'KEY'{RESET}.",
+    help="Set the [cyan]'VALUE'[/] of a specific "
+    "configuration variable by its [cyan]'KEY'[/].",
 )
 @click.argument("key", type=str, required=True)
 @click.argument("value", type=str, required=True)
@@ -67,12 +66,8 @@ def set_value(key: str, value: str, force: bool, debug: bool) -> None:
             debug=debug,
         )
     except KeyError:
-        matched = list(
-            fuzzyfinder(
-                key,
-                VariableLibrary.get_config().get_keys(non_dict_only=True),
-                highlight=True,
-            )
+        matched = get_suggestions(
+            key, VariableLibrary.get_config().get_keys(non_dict_only=True)
         )
         return print_error_message(
             error=KeyError(
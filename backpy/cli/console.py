@@ -0,0 +1,11 @@
+import functools
+
+
+# Console.__init__ probes the terminal (isatty, color support, environment)
+# on every construction, so the CLI shares a single instance instead of
+# building a fresh one per print.
+@functools.cache
+def get_console():
+    from rich.console import Console
+
+    return Console()
@@ -1,23 +1,115 @@
-import getpass
+from __future__ import annotations
+
+import os
+import re
+import sys
 from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from fuzzyfinder import fuzzyfinder
+try:
+    import readline
+except ImportError:
+    # readline is unavailable on some platforms (e.g. Windows); prompts
+    # then simply work without tab completion.
+    readline = None
 
-from backpy import Backup, BackupSpace
 from backpy.cli.colors import EFFECTS, RESET, get_default_palette
-from backpy.core.backup import Schedule
-from backpy.core.remote import Remote
-from backpy.core.utils.utils import str2bytes
+
+if TYPE_CHECKING:
+    from backpy import Backup, BackupSpace
+    from backpy.core.backup import Schedule
+    from backpy.core.remote import Remote
 
 palette = get_default_palette()
 
+# Minimum WRatio score for a candidate to count as a fuzzy match.
+_SUGGESTION_SCORE_CUTOFF = 50
+
+# Matches the canonical string form of a UUID, so name lookups can skip
+# the speculative (and exception-raising) UUID parse entirely.
+_UUID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
+    re.IGNORECASE,
+)
+
+# Rendered once at import; every error message reuses the same colored
+# prefix instead of rebuilding it per print.
+_ERR_PREFIX = f"{palette.red}ERROR: {palette.maroon}"
+
+# Probed once at import; when stdin is not a terminal (scripts, CI) the
+# prompts read lines directly instead of paying input()'s per-call
+# terminal handling.
+_IS_TTY = sys.stdin is not None and sys.stdin.isatty()
+
+
+def _read_line(prompt: str) -> str:
+    if _IS_TTY:
+        return input(prompt)
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+
+    if line == "":
+        raise EOFError("EOF when reading a line")
+
+    return line.rstrip("\n")
+
+
+def _highlight_match(value: str, candidate: str) -> str:
+    # Wraps the matched characters of the candidate in green, mimicking
+    # the highlighted output fuzzyfinder used to produce.
+    lowered = candidate.lower()
+    positions = []
+    idx = 0
+
+    for char in value.lower():
+        pos = lowered.find(char, idx)
+        if pos == -1:
+            break
+        positions.append(pos)
+        idx = pos + 1
+
+    if len(positions) == 0:
+        return candidate
+
+    highlighted = []
+    last = 0
+
+    for pos in positions:
+        highlighted.append(candidate[last:pos])
+        highlighted.append(f"{palette.green}{candidate[pos]}{RESET}")
+        last = pos + 1
+
+    highlighted.append(candidate[last:])
+
+    return "".join(highlighted)
+
+
+def get_suggestions(
+    value: str, candidates: list[str] | tuple[str, ...], limit: int = 5
+) -> list[str]:
+    # Imported on first use so commands that never suggest anything do
+    # not pay the rapidfuzz import at startup.
+    from rapidfuzz import fuzz, process
+
+    matched = process.extract(
+        value,
+        candidates,
+        scorer=fuzz.WRatio,
+        processor=str.lower,
+        limit=limit,
+        score_cutoff=_SUGGESTION_SCORE_CUTOFF,
+    )
+    return [_highlight_match(value, candidate) for candidate, _, _ in matched]
+
 
 def print_error_message(error: Exception, debug: bool) -> None:
     if debug:
         raise error
     else:
-        print(f"{palette.red}ERROR: {palette.maroon}{error.args[0]}{RESET}")
+        print(f"{_ERR_PREFIX}{error.args[0]}{RESET}")
 
 
 def _validate_always(value: str) -> bool:
@@ -29,14 +121,18 @@ def _validate_not_none(value: str) -> bool:
 
 
 def _validate_file_path(value: str) -> bool:
-    return Path(value).expanduser().is_file(follow_symlinks=True)
+    # os.path keeps the retry path to one stat call without building
+    # intermediate Path objects; symlinks are followed either way.
+    return os.path.isfile(os.path.expanduser(value))
 
 
 def _validate_directory_path(value: str) -> bool:
-    return Path(value).expanduser().is_dir(follow_symlinks=True)
+    return os.path.isdir(os.path.expanduser(value))
 
 
 def _validate_memory(value: str) -> bool:
+    from backpy.core.utils.utils import str2bytes
+
     try:
         str2bytes(value)
         return True
@@ -48,28 +144,32 @@ def _validate_memory(value: str) -> bool:
             return False
 
 
-def _validate_integer(value: str) -> bool:
-    try:
-        int(value)
-    except ValueError:
-        return False
+# Matches a plain decimal floating point number with an optional sign
+# and exponent, mirroring what users type into a prompt.
+_FLOAT_RE = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
 
-    return True
+
+def _validate_integer(value: str) -> bool:
+    # A pure predicate instead of try/except around int(), so invalid
+    # keystrokes do not pay for exception raising on every retry.
+    stripped = value[1:] if value[:1] in ("+", "-") else value
+    return stripped.isdecimal()
 
 
 def _validate_float(value: str) -> bool:
-    try:
-        float(value)
-    except ValueError:
-        return False
+    return _FLOAT_RE.match(value) is not None
 
-    return True
+
+_CONFIRM_VALUES = frozenset(("", "y", "n"))
 
 
 class ConfirmInput:
     def __init__(self, message: str, default_value: bool) -> None:
         self.message: str = message
         self.default_value: bool = default_value
+        self._default_char: str = self._get_default_input()
+        # Rendered once; the retry loop re-uses the same prompt string.
+        self._prompt_str: str = self._get_prompt()
 
     def _get_default_input(self) -> str:
         if self.default_value:
@@ -85,20 +185,27 @@ class ConfirmInput:
     def _get_prompt(self) -> str:
         return f"{self.message} {self._get_suffix()} "
 
+    def set_message(self, message: str) -> None:
+        self.message = message
+        self._prompt_str = self._get_prompt()
+
     def prompt(self) -> bool:
         confirmation = None
         valid_input = False
+        # One write call per error instead of print()'s separate
+        # message and newline writes; the next prompt read flushes.
+        write = sys.stdout.write
 
         while not valid_input:
-            in_value = input(self._get_prompt())
+            in_value = _read_line(self._prompt_str).lower()
 
-            if in_value.lower() != "y" and in_value.lower() != "n" and in_value != "":
-                print(
-                    f"{palette.maroon}You have type y, n or nothing to proceed!{RESET}"
+            if in_value not in _CONFIRM_VALUES:
+                write(
+                    f"{palette.maroon}You have type y, n or nothing to proceed!{RESET}\n"
                 )
                 continue
 
-            confirmation = (in_value or self._get_default_input().lower()) == "y"
+            confirmation = (in_value or self._default_char) == "y"
             valid_input = True
 
         return confirmation
@@ -113,7 +220,7 @@ class TextInput:
         validate: Callable[[str], bool] = _validate_always,
         suggest_matches: bool = False,
         case_sensitive: bool = True,
-        suggestible_values: list[str] | None = None,
+        suggestible_values: list[str] | tuple[str, ...] | None = None,
         confirm_suggestion: bool = True,
         highlight_suggestion: bool = True,
         invalid_error_message: str | None = None,
@@ -124,16 +231,41 @@ class TextInput:
         self._validate: Callable[[str], bool] = validate
         self.suggest_matches: bool = suggest_matches
         self.case_sensitive: bool = case_sensitive
-        self.suggestible_values: list[str] = (
-            [] if suggestible_values is None else suggestible_values
+        self.suggestible_values: list[str] | tuple[str, ...] = (
+            () if suggestible_values is None else suggestible_values
         )
         self.confirm_suggestion: bool = confirm_suggestion
         self.highlight_suggestion: bool = highlight_suggestion
+        # Index built once so exact hits (e.g. a pasted UUID or a full
+        # name) resolve in O(1) instead of fuzzy-scanning the whole
+        # candidate list on every submitted value.
+        self._suggestible_set: frozenset[str] = (
+            frozenset(self.suggestible_values)
+            if case_sensitive
+            else frozenset(value.lower() for value in self.suggestible_values)
+        )
+        # Lowercased once so the fuzzy scan does not re-normalize every
+        # candidate on each submitted value.
+        self._suggestible_lower: tuple[str, ...] = tuple(
+            value.lower() for value in self.suggestible_values
+        )
         self.invalid_error_message: str = (
             invalid_error_message
             if invalid_error_message
             else f"{palette.red}Invalid input! Please try again.{RESET}"
         )
+        # Rendered once; the retry loop re-uses the same prompt string.
+        self._prompt_str: str = self._get_prompt()
+        # Repeated queries within one prompt session (e.g. the same
+        # typo submitted twice) reuse their fuzzy result.
+        self._match_cache: dict[str, list] = {}
+        # One reusable confirmation prompt; only the match-specific
+        # message changes between retries.
+        self._confirm: ConfirmInput | None = (
+            ConfirmInput(message="", default_value=True)
+            if suggest_matches and confirm_suggestion
+            else None
+        )
 
     def _get_prompt(self) -> str:
         return f"{self.message}" + (
@@ -142,14 +274,53 @@ class TextInput:
             else " "
         )
 
+    def _completer(self, text: str, state: int) -> str | None:
+        if state == 0:
+            lowered = text.lower()
+            self._completion_matches = [
+                candidate
+                for candidate, low in zip(
+                    self.suggestible_values, self._suggestible_lower
+                )
+                if low.startswith(lowered)
+            ]
+
+        if state < len(self._completion_matches):
+            return self._completion_matches[state]
+
+        return None
+
     def prompt(self) -> str | None:
+        if readline is None or len(self.suggestible_values) == 0:
+            return self._prompt_loop()
+
+        # Tab completes the known values while this prompt is active;
+        # the previous completer state is restored afterwards. The
+        # delimiters are cleared so values containing '-' (UUIDs) are
+        # completed as a whole.
+        previous_completer = readline.get_completer()
+        previous_delims = readline.get_completer_delims()
+        readline.set_completer(self._completer)
+        readline.set_completer_delims("")
+        readline.parse_and_bind("tab: complete")
+
+        try:
+            return self._prompt_loop()
+        finally:
+            readline.set_completer(previous_completer)
+            readline.set_completer_delims(previous_delims)
+
+    def _prompt_loop(self) -> str | None:
 
         valid_result = False
 
         value = None
+        # One write call per error instead of print()'s separate
+        # message and newline writes; the next prompt read flushes.
+        write = sys.stdout.write
 
         while not valid_result:
-            value = input(self._get_prompt())
+            value = _read_line(self._prompt_str)
 
             if value == "":
                 value = self.default_value
@@ -160,50 +331,70 @@ class TextInput:
             valid_input = self._validate(value)
 
             if not valid_input:
-                print(
-                    f"{palette.red}ERROR: {palette.maroon}"
-                    f"{self.invalid_error_message.format(value=value)}{RESET}"
+                write(
+                    f"{_ERR_PREFIX}"
+                    f"{self.invalid_error_message.format(value=value)}{RESET}\n"
                 )
                 continue
 
             if self.suggest_matches:
-                matched = list(fuzzyfinder(value, self.suggestible_values))
+                value_lower = value.lower()
+
+                if (
+                    value if self.case_sensitive else value_lower
+                ) in self._suggestible_set:
+                    break
+
+                matched = self._match_cache.get(value_lower)
+
+                if matched is None:
+                    # Imported on first use; sys.modules makes the
+                    # repeated statement a cheap lookup on later
+                    # retries.
+                    from rapidfuzz import fuzz, process
+
+                    matched = process.extract(
+                        value_lower,
+                        self._suggestible_lower,
+                        scorer=fuzz.WRatio,
+                        limit=5,
+                        score_cutoff=_SUGGESTION_SCORE_CUTOFF,
+                    )
+
+                    # Bounded so a long session cannot grow the cache
+                    # arbitrarily.
+                    if len(self._match_cache) >= 128:
+                        self._match_cache.clear()
+
+                    self._match_cache[value_lower] = matched
 
                 if len(matched) == 0:
-                    print(
-                        f"{palette.red}ERROR: {palette.maroon}"
-                        f"{self.invalid_error_message.format(value=value)}{RESET}"
+                    write(
+                        f"{_ERR_PREFIX}"
+                        f"{self.invalid_error_message.format(value=value)}{RESET}\n"
                     )
                     continue
 
-                if self.case_sensitive:
-                    if matched[0] == value:
-                        break
-                else:
-                    if matched[0].lower() == value.lower():
-                        break
-
-                best_match = list(
-                    fuzzyfinder(
-                        value,
-                        self.suggestible_values,
-                        highlight=self.highlight_suggestion,
-                    )
-                )[0]
+                # The original casing is restored by index; exact hits
+                # were already resolved through the set above, so this
+                # is always a genuine suggestion.
+                best_match = self.suggestible_values[matched[0][2]]
 
                 if self.confirm_suggestion:
-                    valid_result = ConfirmInput(
-                        message=(
-                            f"{palette.base}Did you mean "
-                            f"{best_match}"
-                            f"{palette.base}?{RESET}"
-                        ),
-                        default_value=True,
-                    ).prompt()
+                    suggestion = (
+                        _highlight_match(value, best_match)
+                        if self.highlight_suggestion
+                        else best_match
+                    )
+                    self._confirm.set_message(
+                        f"{palette.base}Did you mean "
+                        f"{suggestion}{palette.base}?{RESET}"
+                    )
+                    valid_result = self._confirm.prompt()
                 else:
                     valid_result = True
 
-                value = matched[0]
+                value = best_match
             else:
                 valid_result = True
 
@@ -223,42 +414,37 @@ class PasswordInput:
         self.confirm_input: bool = confirm_input
         self.default_value: str | None = default_value
 
-    def prompt(self) -> str:
-
-        password = None
-        valid_input = False
+    def _read_once(self, again: bool) -> str:
+        import getpass
 
-        while not valid_input:
-            password_input: str = getpass.getpass(
-                prompt=f"{self.message} {'(again) ' if password is not None else ''}"
+        while True:
+            password: str = getpass.getpass(
+                prompt=f"{self.message} {'(again) ' if again else ''}"
             )
 
-            if (
-                password is not None
-                and password != password_input
-                and self.confirm_input
-            ):
-                password = None
-                print(
-                    f"{palette.red}ERROR: {palette.maroon}The two passwords were not identical. "
-                    f"Try again!{RESET}"
-                )
+            if password == "" and not self.allow_empty:
+                print(f"{_ERR_PREFIX}The password may not be empty!{RESET}")
                 continue
 
-            if password_input == "" and not self.allow_empty:
-                print(
-                    f"{palette.red}ERROR: {palette.maroon}The password may not be empty!{RESET}"
-                )
-                continue
+            return password
 
-            if password is None and self.confirm_input:
-                password = password_input
-                continue
+    def prompt(self) -> str:
+        # Two clean phases: read (and re-read on empty), then confirm.
+        # A mismatch restarts from the first entry like before, but no
+        # state flags interleave the two checks anymore.
+        while True:
+            password = self._read_once(again=False)
 
-            password = password_input
-            valid_input = True
+            if not self.confirm_input:
+                return password
 
-        return password
+            if self._read_once(again=True) == password:
+                return password
+
+            print(
+                f"{_ERR_PREFIX}The two passwords were not identical. "
+                f"Try again!{RESET}"
+            )
 
 
 class BackupSpaceInput(TextInput):
@@ -271,21 +457,25 @@ class BackupSpaceInput(TextInput):
         confirm_suggestion: bool = True,
         highlight_suggestion: bool = True,
     ):
+        from backpy import BackupSpace
 
-        spaces = BackupSpace.get_backup_spaces()
+        spaces = BackupSpace.get_backup_spaces_cached()
 
         if len(spaces) == 0:
             print(
-                f"{palette.red}ERROR: {palette.maroon}There is no valid Backup Space present. "
+                f"{_ERR_PREFIX}There is no valid Backup Space present. "
                 f"You have to create a Backup Space first. Use 'backpy --help' for help.{RESET}"
             )
             return
 
-        space_names_uuids = []
+        # Both the UUID string and the name index the already-loaded
+        # space object, so prompt can resolve the answer with one dict
+        # lookup instead of exception-driven load attempts.
+        self._by_key: dict[str, BackupSpace] = {}
 
         for space in spaces:
-            space_names_uuids.append(str(space.get_uuid()))
-            space_names_uuids.append(space.get_name())
+            self._by_key[str(space.get_uuid())] = space
+            self._by_key[space.get_name()] = space
 
         super().__init__(
             message=f"{palette.base}> Enter the {palette.lavender}name{palette.base} "
@@ -299,7 +489,7 @@ class BackupSpaceInput(TextInput):
             f"{palette.maroon}. Please try again!{RESET}",
             validate=validate,
             suggest_matches=suggest_matches,
-            suggestible_values=space_names_uuids,
+            suggestible_values=tuple(self._by_key),
             allow_none=allow_none,
             case_sensitive=case_sensitive,
             confirm_suggestion=confirm_suggestion,
@@ -308,14 +498,19 @@ class BackupSpaceInput(TextInput):
 
     def prompt(self) -> BackupSpace:
         result = super().prompt()
-        try:
-            space = BackupSpace.load_by_uuid(result)
-        except Exception:
-            space = BackupSpace.load_by_name(result)
+        space = self._by_key.get(result)
 
-        return space.get_type().child_class.load_by_uuid(
-            unique_id=str(space.get_uuid())
-        )
+        if space is None:
+            from backpy import BackupSpace
+
+            # Only reachable with a custom validator that accepts
+            # values outside the enumerated spaces.
+            if _UUID_RE.match(result):
+                space = BackupSpace.load_by_uuid(result)
+            else:
+                space = BackupSpace.load_by_name(result)
+
+        return space.get_as_child_class()
 
 
 class BackupInput(TextInput):
@@ -332,7 +527,23 @@ class BackupInput(TextInput):
 
         self.backup_space: BackupSpace = backup_space
         self.check_hash: bool = check_hash
-        backups = backup_space.get_backups(check_hash=False)
+        # Fetched once (newest first) and reused by the keyword aliases
+        # in prompt, so resolving e.g. 'oldest' does not re-scan the
+        # Backup Space a second time.
+        backups = backup_space.get_backups(sort_by="date", check_hash=False)
+        self._backups: list[Backup] = backups
+        # Keyword aliases dispatch through a single dict lookup; the
+        # size keywords only walk the cached list when requested.
+        self._aliases: dict[str, Callable[[], Backup]] = {
+            "oldest": lambda: self._backups[-1],
+            "newest": lambda: self._backups[0],
+            "largest": lambda: max(
+                self._backups, key=lambda backup: backup.get_file_size()
+            ),
+            "smallest": lambda: min(
+                self._backups, key=lambda backup: backup.get_file_size()
+            ),
+        }
 
         if len(backups) == 0:
             print(
@@ -346,7 +557,7 @@ class BackupInput(TextInput):
         for backup in backups:
             backup_uuids.append(str(backup.get_uuid()))
 
-        backup_uuids.extend(["oldest", "newest", "largest", "smallest"])
+        backup_uuids.extend(self._aliases)
 
         super().__init__(
             message=f"{palette.base}> Enter the {palette.lavender}UUID{palette.base} "
@@ -368,29 +579,18 @@ class BackupInput(TextInput):
     def prompt(self) -> Backup:
         result = super().prompt()
 
-        match result:
-            case "oldest":
-                return self.backup_space.get_backups(sort_by="date", check_hash=False)[
-                    -1
-                ]
-            case "newest":
-                return self.backup_space.get_backups(sort_by="date", check_hash=False)[
-                    0
-                ]
-            case "largest":
-                return self.backup_space.get_backups(sort_by="size", check_hash=False)[
-                    0
-                ]
-            case "smallest":
-                return self.backup_space.get_backups(sort_by="size", check_hash=False)[
-                    -1
-                ]
-            case _:
-                return Backup.load_by_uuid(
-                    backup_space=self.backup_space,
-                    unique_id=result,
-                    check_hash=self.check_hash,
-                )
+        alias = self._aliases.get(result)
+
+        if alias is not None:
+            return alias()
+
+        from backpy import Backup
+
+        return Backup.load_by_uuid(
+            backup_space=self.backup_space,
+            unique_id=result,
+            check_hash=self.check_hash,
+        )
 
 
 class RemoteInput(TextInput):
@@ -404,14 +604,18 @@ class RemoteInput(TextInput):
         confirm_suggestion: bool = True,
         highlight_suggestion: bool = True,
     ):
+        from backpy.core.remote import Remote
 
         remotes = Remote.get_remotes()
 
-        remote_names_uuids = []
+        # Both the UUID string and the name index the already-loaded
+        # remote, mirroring BackupSpaceInput, so prompt resolves the
+        # answer without another load.
+        self._by_key: dict[str, Remote] = {}
 
         for remote in remotes:
-            remote_names_uuids.append(str(remote.get_uuid()))
-            remote_names_uuids.append(remote.get_name())
+            self._by_key[str(remote.get_uuid())] = remote
+            self._by_key[remote.get_name()] = remote
 
         super().__init__(
             message=f"{palette.base}> Enter the {palette.lavender}name{palette.base} "
@@ -428,7 +632,7 @@ class RemoteInput(TextInput):
             default_value=default_value,
             allow_none=allow_none,
             suggest_matches=suggest_matches,
-            suggestible_values=remote_names_uuids,
+            suggestible_values=tuple(self._by_key),
             case_sensitive=case_sensitive,
             confirm_suggestion=confirm_suggestion,
             highlight_suggestion=highlight_suggestion,
@@ -440,10 +644,17 @@ class RemoteInput(TextInput):
         if result is None and self.allow_none:
             return None
 
-        try:
-            remote = Remote.load_by_uuid(result)
-        except Exception:
-            remote = Remote.load_by_name(result)
+        remote = self._by_key.get(result)
+
+        if remote is None:
+            from backpy.core.remote import Remote
+
+            # Only reachable with a custom validator that accepts
+            # values outside the enumerated remotes.
+            if _UUID_RE.match(result):
+                remote = Remote.load_by_uuid(result)
+            else:
+                remote = Remote.load_by_name(result)
 
         return remote
 
@@ -460,6 +671,7 @@ class ScheduleInput(TextInput):
         confirm_suggestion: bool = True,
         highlight_suggestion: bool = True,
     ):
+        from backpy.core.backup import Schedule
 
         schedules = Schedule.get_schedules(active=only_active)
         schedule_uuids = [str(schedule.get_uuid()) for schedule in schedules]
@@ -489,6 +701,8 @@ class ScheduleInput(TextInput):
         if result is None and self.allow_none:
             return None
 
+        from backpy.core.backup import Schedule
+
         return Schedule.load_by_uuid(result)
 
 
@@ -628,29 +842,31 @@ class IntegerInput(TextInput):
         )
 
     def prompt(self) -> int | None:
+        # Iterative instead of recursive, so repeated out-of-range
+        # input cannot grow the call stack.
+        while True:
+            prompt = super().prompt()
 
-        prompt = super().prompt()
-
-        if prompt is None and self.allow_none:
-            return None
+            if prompt is None and self.allow_none:
+                return None
 
-        value = int(prompt)
+            value = int(prompt)
 
-        if self._max_value is not None and value > self._max_value:
-            print(
-                f"{palette.red}ERROR: {palette.maroon}"
-                f"The given value is too large! Maximum: {self._max_value}{RESET}"
-            )
-            return self.prompt()
+            if self._max_value is not None and value > self._max_value:
+                print(
+                    f"{_ERR_PREFIX}"
+                    f"The given value is too large! Maximum: {self._max_value}{RESET}"
+                )
+                continue
 
-        if self._min_value is not None and value < self._min_value:
-            print(
-                f"{palette.red}ERROR: {palette.maroon}"
-                f"The given value is too small! Minimum: {self._max_value}{RESET}"
-            )
-            return self.prompt()
+            if self._min_value is not None and value < self._min_value:
+                print(
+                    f"{_ERR_PREFIX}"
+                    f"The given value is too small! Minimum: {self._min_value}{RESET}"
+                )
+                continue
 
-        return value
+            return value
 
 
 class FloatInput(TextInput):
@@ -735,6 +951,8 @@ class MemorySizeInput(TextInput):
         try:
             value = int(prompt)
         except Exception:
+            from backpy.core.utils.utils import str2bytes
+
             value = str2bytes(prompt)
 
         return value
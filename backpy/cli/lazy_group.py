@@ -0,0 +1,41 @@
+import importlib
+
+import rich_click as click
+
+
+# Lazy subcommand loading pattern taken from
+# https://click.palletsprojects.com/en/stable/complex/#using-lazygroup
+class LazyGroup(click.RichGroup):
+    def __init__(
+        self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+        # Maps the name of a subcommand to the import path of the
+        # click.Command object implementing it ("module:attribute").
+        # The module is only imported once the subcommand is invoked.
+        self.lazy_subcommands: dict[str, str] = (
+            lazy_subcommands if lazy_subcommands is not None else {}
+        )
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return super().list_commands(ctx) + list(self.lazy_subcommands)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _lazy_load(self, cmd_name: str) -> click.Command:
+        import_path = self.lazy_subcommands[cmd_name]
+        module_name, attribute_name = import_path.split(":", 1)
+
+        command = getattr(importlib.import_module(module_name), attribute_name)
+
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"The lazy subcommand import path '{import_path}' does not "
+                "resolve to a click.Command object!"
+            )
+
+        return command
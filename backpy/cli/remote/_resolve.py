@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from backpy.cli.elements import _UUID_RE, print_error_message
+from backpy.core.utils.exceptions import InvalidRemoteError
+
+if TYPE_CHECKING:
+    from backpy.core.remote import Remote
+
+
+def resolve_remote(identifier: str, debug: bool) -> "Remote | None":
+    from backpy.core.remote import Remote
+
+    try:
+        if _UUID_RE.match(identifier):
+            remote = Remote.load_by_uuid(unique_id=identifier)
+        else:
+            remote = Remote.load_by_name(name=identifier)
+    except InvalidRemoteError:
+        print_error_message(
+            error=InvalidRemoteError(
+                "The given name or UUID does not match any remote's name or UUID!"
+            ),
+            debug=debug,
+        )
+        return None
+
+    return remote
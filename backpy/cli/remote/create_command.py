@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 
 import rich_click as click
@@ -12,51 +13,91 @@ from backpy.cli.elements import (
     TextInput,
     print_error_message,
 )
-from backpy.core.remote.remote import protocols
-from backpy.core.utils.exceptions import InvalidRemoteError
+from backpy.core.remote.remote import protocol_names
 
 palette = get_default_palette()
 
-protocol_names = [protocol.name for protocol in protocols]
+# The interactive prompts are entirely static; interpolating the palette
+# once at import keeps the prompt loop free of string building.
+_MSG_ALIAS = f"{palette.base}> Enter an alias for the remote:{RESET}"
+_ERR_ALIAS_EMPTY = f"{palette.maroon}The alias may not be empty!{RESET}"
+_ERR_NAME_TAKEN = (
+    f"{palette.red}ERROR:{palette.maroon} The given name is already "
+    f"taken by another remote. The provided name has to be unique!"
+)
+_MSG_PROTOCOL = (
+    f"{palette.base}> Enter the desired transfer protocol "
+    f"({palette.overlay1}available: {', '.join(protocol_names)}{palette.base}):{RESET}"
+)
+_ERR_PROTOCOL = f"{palette.maroon}Invalid protocol! Please try again.{RESET}"
+_MSG_HOSTNAME = f"{palette.base}> Enter the hostname of the remote:{RESET}"
+_MSG_USERNAME = (
+    f"{palette.base}> Enter the username with which to connect to the remote:{RESET}"
+)
+_ERR_USERNAME_EMPTY = f"{palette.maroon}The username may not be empty!{RESET}"
+_MSG_KEY_PATH = (
+    f"{palette.base}> Enter the path to an SSH key which should be used to connect "
+    f"to the remote (optional):{RESET}"
+)
+_MSG_KEY_PASSPHRASE = (
+    f"{palette.base}> Enter the passphrase of the SSH key (may be empty):{RESET}"
+)
+_MSG_SYSTEM_KEYS = (
+    f"{palette.base}> Should backpy try to use SSH keys from your system's "
+    f"SSH agent for authentication?{RESET}"
+)
+_MSG_PASSWORD = f"{palette.base}> Enter the password for the user:{RESET}"
+_MSG_TIMEOUT = (
+    f"{palette.base}> Enter the maximum duration in seconds "
+    f"to wait for the connection:{RESET}"
+)
+_MSG_ROOT_DIR = (
+    f"{palette.base}> Enter the root directory of backpy on the remote:{RESET}"
+)
+_MSG_SHA256_CMD = (
+    f"{palette.base}> Enter the shell command to calculate a file's SHA-256 sum on "
+    f"the remote server:{RESET}"
+)
+
+
+@functools.cache
+def _default_variable(key: str) -> str:
+    # The defaults are read for the Click options at import time and
+    # again interactively; one stat + dict walk per key is enough for
+    # the lifetime of a CLI invocation.
+    return VariableLibrary.get_variable(key)
 
 
 def create_interactive(verbosity_level: int, debug: bool) -> None:
 
-    unique_name = False
-    while not unique_name:
+    while True:
         name = TextInput(
-            message=f"{palette.base}> Enter an alias for the remote:{RESET}",
-            invalid_error_message=f"{palette.maroon}The alias may not be empty!{RESET}",
+            message=_MSG_ALIAS,
+            invalid_error_message=_ERR_ALIAS_EMPTY,
         ).prompt()
 
-        try:
-            Remote.load_by_name(name=name)
-        except InvalidRemoteError:
+        if not Remote.name_exists(name=name):
             break
 
-        print(
-            f"{palette.red}ERROR:{palette.maroon} The given name is already "
-            f"taken by another remote. The provided name has to be unique!"
-        )
+        print(_ERR_NAME_TAKEN)
 
     protocol = TextInput(
-        message=f"{palette.base}> Enter the desired transfer protocol "
-        f"({palette.overlay1}available: {', '.join(protocol_names)}{palette.base}):{RESET}",
+        message=_MSG_PROTOCOL,
         suggest_matches=True,
         suggestible_values=protocol_names,
-        invalid_error_message=f"{palette.maroon}Invalid protocol! Please try again.{RESET}",
+        invalid_error_message=_ERR_PROTOCOL,
     ).prompt()
 
     protocol = Protocol.from_name(name=protocol)
 
     hostname = TextInput(
-        message=f"{palette.base}> Enter the hostname of the remote:{RESET}",
-        invalid_error_message=f"{palette.maroon}The alias may not be empty!{RESET}",
+        message=_MSG_HOSTNAME,
+        invalid_error_message=_ERR_ALIAS_EMPTY,
     ).prompt()
 
     username = TextInput(
-        message=f"{palette.base}> Enter the username with which to connect to the remote:{RESET}",
-        invalid_error_message=f"{palette.maroon}The username may not be empty!{RESET}",
+        message=_MSG_USERNAME,
+        invalid_error_message=_ERR_USERNAME_EMPTY,
     ).prompt()
 
     key_path = None
@@ -65,50 +106,43 @@ def create_interactive(verbosity_level: int, debug: bool) -> None:
 
     if protocol.supports_ssh_keys:
         key_path = FilePathInput(
-            message=f"{palette.base}> Enter the path to an SSH key which should be used to connect "
-            f"to the remote (optional):{RESET}",
+            message=_MSG_KEY_PATH,
             allow_none=True,
         ).prompt()
 
         if key_path is not None:
             password = PasswordInput(
-                message=f"{palette.base}> Enter the passphrase of the SSH key "
-                f"(may be empty):{RESET}",
+                message=_MSG_KEY_PASSPHRASE,
                 allow_empty=True,
                 confirm_input=False,
             ).prompt()
 
         use_system_keys = ConfirmInput(
-            message=f"{palette.base}> Should backpy try to use SSH keys from your system's "
-            f"SSH agent for authentication?{RESET}",
+            message=_MSG_SYSTEM_KEYS,
             default_value=False,
         ).prompt()
 
     if not protocol.supports_ssh_keys or key_path is None:
         password = PasswordInput(
-            message=f"{palette.base}> Enter the password for the user:{RESET}",
+            message=_MSG_PASSWORD,
             allow_empty=False,
             confirm_input=False,
         ).prompt()
 
     timeout = IntegerInput(
-        message=f"{palette.base}> Enter the maximum duration in seconds "
-        f"to wait for the connection:{RESET}",
+        message=_MSG_TIMEOUT,
         default_value=None,
         allow_none=True,
     ).prompt()
 
     root_dir = TextInput(
-        message=f"{palette.base}> Enter the root directory of backpy on the remote:{RESET}",
-        default_value=VariableLibrary.get_variable(
-            "backup.states.default_remote_root_dir"
-        ),
+        message=_MSG_ROOT_DIR,
+        default_value=_default_variable("backup.states.default_remote_root_dir"),
     ).prompt()
 
     sha256_cmd = TextInput(
-        message=f"{palette.base}> Enter the shell command to calculate a file's SHA-256 sum on "
-        f"the remote server:{RESET}",
-        default_value=VariableLibrary.get_variable("backup.states.default_sha256_cmd"),
+        message=_MSG_SHA256_CMD,
+        default_value=_default_variable("backup.states.default_sha256_cmd"),
     ).prompt()
 
     remote = Remote.new(
@@ -186,14 +220,14 @@ def create_interactive(verbosity_level: int, debug: bool) -> None:
 @click.option(
     "--root-dir",
     type=str,
-    default=VariableLibrary.get_variable("backup.states.default_remote_root_dir"),
+    default=_default_variable("backup.states.default_remote_root_dir"),
     help="The backpy root directory on the remote server. If not set, the default value set in the "
     "variable configuration is used.",
 )
 @click.option(
     "--sha256-cmd",
     type=str,
-    default=VariableLibrary.get_variable("backup.states.default_sha256_cmd"),
+    default=_default_variable("backup.states.default_sha256_cmd"),
     help="The shell command to calculate a file's SHA-256 sum on the remote server. "
     "If not set, the default value set in the variable configuration is used.",
 )
@@ -233,11 +267,7 @@ def create(
     if interactive:
         return create_interactive(verbosity_level=verbose, debug=debug)
 
-    try:
-        Remote.load_by_name(name=name)
-    except InvalidRemoteError:
-        pass
-    else:
+    if Remote.name_exists(name=name):
         return print_error_message(
             error=NameError(
                 "The given name is already "
@@ -264,7 +294,7 @@ def create(
         ).prompt()
     else:
         password = PasswordInput(
-            message=f"{palette.base}> Enter the password for the user:{RESET}",
+            message=_MSG_PASSWORD,
             allow_empty=False,
             confirm_input=False,
         ).prompt()
@@ -1,16 +1,14 @@
 import rich_click as click
 
 from backpy.cli.colors import RESET, get_default_palette
-from backpy.cli.elements import ConfirmInput, print_error_message
-from backpy.core.remote import Remote
-from backpy.core.utils.exceptions import InvalidRemoteError
+from backpy.cli.elements import ConfirmInput
 
 palette = get_default_palette()
 
 
 @click.command(
     "delete",
-    help=f"Delete a {palette.sky}'REMOTE'{RESET} identified by its name or UUID.",
+    help="Delete a [cyan]'REMOTE'[/] identified by its name or UUID.",
 )
 @click.argument("remote", type=str, required=True)
 @click.option(
@@ -40,18 +38,12 @@ def delete(
 ) -> None:
     verbose += 1
 
-    try:
-        remote = Remote.load_by_uuid(unique_id=remote)
-    except Exception:
-        try:
-            remote = Remote.load_by_name(name=remote)
-        except Exception:
-            return print_error_message(
-                error=InvalidRemoteError(
-                    "The given name or UUID does not match any remote's name or UUID!"
-                ),
-                debug=debug,
-            )
+    from backpy.cli.remote._resolve import resolve_remote
+
+    remote = resolve_remote(remote, debug=debug)
+
+    if remote is None:
+        return None
 
     confirm = False or force
 
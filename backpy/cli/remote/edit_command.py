@@ -2,21 +2,17 @@ from pathlib import Path
 
 import rich_click as click
 
-from backpy import Protocol, Remote
+from backpy import Protocol
 from backpy.cli.colors import RESET, get_default_palette
-from backpy.cli.elements import PasswordInput, print_error_message
-from backpy.core.remote.password import encrypt
-from backpy.core.remote.remote import protocols
-from backpy.core.utils.exceptions import InvalidRemoteError
-
-protocol_names = [protocol.name for protocol in protocols]
+from backpy.cli.elements import PasswordInput
+from backpy.core.remote.remote import protocol_names
 
 palette = get_default_palette()
 
 
 @click.command(
     "edit",
-    help=f"Edit a {palette.sky}'REMOTE'{RESET} identified by its name or UUID.",
+    help="Edit a [cyan]'REMOTE'[/] identified by its name or UUID.",
 )
 @click.argument("remote", type=str, required=True)
 @click.option("--name", "-n", type=str, default=None, help="The alias of the remote.")
@@ -114,18 +110,12 @@ def edit(
 
     verbose += 1
 
-    try:
-        remote = Remote.load_by_uuid(unique_id=remote)
-    except Exception:
-        try:
-            remote = Remote.load_by_name(name=remote)
-        except Exception:
-            return print_error_message(
-                error=InvalidRemoteError(
-                    "The given name or UUID does not match any remote's name or UUID!"
-                ),
-                debug=debug,
-            )
+    from backpy.cli.remote._resolve import resolve_remote
+
+    remote = resolve_remote(remote, debug=debug)
+
+    if remote is None:
+        return None
 
     prev_config = remote._config.as_dict().copy()
 
@@ -150,6 +140,8 @@ def edit(
         remote._use_system_keys = use_system_keys
 
     if password:
+        from backpy.core.remote.password import encrypt
+
         if remote.get_ssh_key() is not None:
             password = PasswordInput(
                 message=f"{palette.base}> Enter the new passphrase of the SSH key "
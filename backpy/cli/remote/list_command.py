@@ -1,10 +1,7 @@
 import rich_click as click
-from rich.console import Console
-from rich.tree import Tree
 
 from backpy.cli.colors import RESET, get_default_palette
 from backpy.cli.elements import print_error_message
-from backpy.core.remote import Remote
 
 palette = get_default_palette()
 
@@ -28,37 +25,41 @@ palette = get_default_palette()
 )
 def list_remotes(depth: int, debug: bool) -> None:
 
+    from rich.console import Console
+    from rich.tree import Tree
+
+    from backpy.core.remote import Remote
+
     tree = Tree(f"{palette.mauve}Remotes{RESET}")
 
     try:
-        remotes = Remote.get_remotes()
+        remotes = Remote.list_remotes_meta()
     except Exception as e:
         return print_error_message(error=e, debug=debug)
 
-    for remote in remotes:
+    for unique_id, name, protocol, hostname, username, ssh_key in remotes:
         remote_branch = tree.add(
-            f"{palette.sky}{remote.get_name()} {palette.lavender}"
-            f"(UUID: {remote.get_uuid()}){RESET}",
+            f"{palette.sky}{name} {palette.lavender}(UUID: {unique_id}){RESET}",
         )
         if depth > 1:
             remote_branch.add(
-                f"{palette.lavender}Protocol: {palette.maroon}{remote.get_protocol().name}{RESET}"
+                f"{palette.lavender}Protocol: {palette.maroon}{protocol}{RESET}"
             )
         if depth > 2:
             remote_branch.add(
-                f"{palette.lavender}Hostname: {palette.maroon}{remote.get_hostname()}{RESET}"
+                f"{palette.lavender}Hostname: {palette.maroon}{hostname}{RESET}"
             )
             remote_branch.add(
-                f"{palette.lavender}Username: {palette.maroon}{remote.get_username()}{RESET}"
+                f"{palette.lavender}Username: {palette.maroon}{username}{RESET}"
             )
         if depth > 3:
             remote_branch.add(
                 f"{palette.lavender}Authentication: {palette.maroon}"
-                f"{'SSH-Key' if remote.get_ssh_key() is not None else 'Password'}{RESET}"
+                f"{'SSH-Key' if ssh_key is not None else 'Password'}{RESET}"
             )
-            if remote.get_ssh_key() is not None:
+            if ssh_key is not None:
                 remote_branch.add(
-                    f"{palette.lavender}Keyfile: {palette.maroon}{remote.get_ssh_key()}{RESET}"
+                    f"{palette.lavender}Keyfile: {palette.maroon}{ssh_key}{RESET}"
                 )
 
     Console().print(tree)
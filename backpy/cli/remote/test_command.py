@@ -1,17 +1,15 @@
 import rich_click as click
 
-from backpy.cli.colors import RESET, get_default_palette
+from backpy.cli.colors import get_default_palette
 from backpy.cli.elements import print_error_message
-from backpy.core.remote import Remote
-from backpy.core.utils.exceptions import InvalidRemoteError
 
 palette = get_default_palette()
 
 
 @click.command(
     "test",
-    help=f"Test the connection of a {palette.sky}'REMOTE'{RESET} identified by "
-    f"its name or UUID.",
+    help="Test the connection of a [cyan]'REMOTE'[/] identified by "
+    "its name or UUID.",
 )
 @click.argument("remote", type=str, required=True)
 @click.option(
@@ -31,18 +29,12 @@ def test(remote: str, verbose: int, debug: bool) -> None:
 
     verbose += 1
 
-    try:
-        remote = Remote.load_by_uuid(unique_id=remote)
-    except Exception:
-        try:
-            remote = Remote.load_by_name(name=remote)
-        except Exception:
-            return print_error_message(
-                error=InvalidRemoteError(
-                    "The given name or UUID does not match any remote's name or UUID!"
-                ),
-                debug=debug,
-            )
+    from backpy.cli.remote._resolve import resolve_remote
+
+    remote = resolve_remote(remote, debug=debug)
+
+    if remote is None:
+        return None
 
     try:
         remote.test_connection(verbosity_level=verbose)
@@ -1,6 +1,6 @@
-import crontab
+import functools
+
 import rich_click as click
-from crontab import CronSlices
 
 from backpy.cli.colors import RESET, get_default_palette
 from backpy.cli.elements import (
@@ -10,80 +10,139 @@ from backpy.cli.elements import (
     TextInput,
     print_error_message,
 )
-from backpy.core.backup import BackupSpace, Schedule
-from backpy.core.utils.exceptions import InvalidBackupSpaceError
 
 palette = get_default_palette()
 
+_LOCATION_CHOICES = ("all", "local", "remote")
+_LOCATIONS = frozenset(_LOCATION_CHOICES)
+
+# The interactive prompts are entirely static; interpolating the palette
+# once at import keeps the prompt loop free of string building.
+_MSG_TIME_PATTERN = (
+    f"{palette.base}> Enter a {palette.lavender}time pattern{palette.base} following "
+    f"which the schedule should be executed. The provided pattern has to be a valid "
+    f"UNIX cron format pattern (e.g. '* */10 * * *' or '@hourly'):{RESET}"
+)
+_ERR_TIME_PATTERN = (
+    f"{palette.maroon}The given value is not a valid UNIX cron "
+    f"time pattern. Please try again.{RESET}"
+)
+_MSG_LOCATION = (
+    f"{palette.base}> Enter at which {palette.lavender}locations{palette.base} "
+    f"the backup should be saved (options: 'all', 'remote', 'local'):{RESET}"
+)
+_ERR_LOCATION = (
+    f"{palette.maroon}The given value is not one of the options "
+    f"{palette.red}('all', 'remote', 'local'). "
+    f"{palette.maroon}Please try again.{RESET}"
+)
+_MSG_DESCRIPTION = (
+    f"{palette.base}> Enter a {palette.lavender}custom description{palette.base} "
+    f"for the schedule (can be empty):{RESET}"
+)
+_MSG_INCLUDE = (
+    f"{palette.base}> Enter a comma-seperated enumeration of {palette.lavender}"
+    f"elements that should be {palette.maroon}included{palette.lavender} in the "
+    f"backups{palette.base} "
+    f"(e.g. paths, patterns, tables, databases) (if empty every non-excluded element "
+    f"will be used):{RESET}"
+)
+_MSG_EXCLUDE = (
+    f"{palette.base}> Enter a comma-seperated enumeration of {palette.lavender}"
+    f"elements that should be {palette.maroon}excluded{palette.lavender} from the "
+    f"backups{palette.base} "
+    f"(e.g. paths, patterns, tables, databases) (can be empty):{RESET}"
+)
+_MSG_ACTIVATE = (
+    f"{palette.base}> Should the schedule be activated after creation?{RESET}"
+)
+
+
+@functools.cache
+def _specials() -> frozenset:
+    # Converted from the crontab dict exactly once per process; kept in
+    # a cached helper so the module stays lazily importable.
+    import crontab
+
+    return frozenset(crontab.SPECIALS)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_valid_cron(pattern: str) -> bool:
+    # The TextInput validator re-runs on every attempt and scripted
+    # invocations repeat the same few patterns, so cache per pattern.
+    from crontab import CronSlices
+
+    # The @-special names are a set lookup; only fall through to the
+    # full cron parse when the pattern is not one of them.
+    if pattern.removeprefix("@") in _specials():
+        return True
+
+    # Cron fields are whitespace separated with at most six of them; the
+    # capped split collapses runs of spaces the way cron itself does.
+    parts = pattern.split(None, 5)
+
+    if not parts:
+        return False
+
+    return CronSlices.is_valid(parts)
+
+
+def _validate_time(value: str) -> bool:
+    return value is not None and _is_valid_cron(value)
+
+
+def _validate_location(value: str) -> bool:
+    return value in _LOCATIONS
+
 
 def create_interactive(verbosity_level: int, debug: bool) -> None:
 
-    space = BackupSpaceInput(suggest_matches=True).prompt()
+    from backpy.core.backup import Schedule
 
-    def _validate_time(value: str) -> bool:
-        if value is None:
-            return False
-        return (
-            CronSlices.is_valid(value.split(" "))
-            or value.removeprefix("@") in crontab.SPECIALS
-        )
+    space = BackupSpaceInput(suggest_matches=True).prompt()
 
     time_pattern = TextInput(
-        message=f"{palette.base}> Enter a {palette.lavender}time pattern{palette.base} following "
-        f"which the schedule should be executed. The provided pattern has to be a valid "
-        f"UNIX cron format pattern (e.g. '* */10 * * *' or '@hourly'):{RESET}",
+        message=_MSG_TIME_PATTERN,
         validate=_validate_time,
-        invalid_error_message=f"{palette.maroon}The given value is not a valid UNIX cron "
-        f"time pattern. Please try again.{RESET}",
+        invalid_error_message=_ERR_TIME_PATTERN,
     ).prompt()
 
-    def _validate_location(value: str):
-        return value in ["all", "local", "remote"]
-
     if space.get_remote() is not None:
         location = TextInput(
-            message=f"{palette.base}> Enter at which {palette.lavender}locations{palette.base} "
-            f"the backup should be saved (options: 'all', 'remote', 'local'):{RESET}",
+            message=_MSG_LOCATION,
             validate=_validate_location,
             default_value="all",
-            invalid_error_message=f"{palette.maroon}The given value is not one of the options "
-            f"{palette.red}('all', 'remote', 'local'). "
-            f"{palette.maroon}Please try again.{RESET}",
+            invalid_error_message=_ERR_LOCATION,
         ).prompt()
     else:
         location = "all"
 
     description = TextInput(
-        message=f"{palette.base}> Enter a {palette.lavender}custom description{palette.base} "
-        f"for the schedule (can be empty):{RESET}",
+        message=_MSG_DESCRIPTION,
         default_value="",
     ).prompt()
 
-    if space.get_type().use_inclusion:
+    space_type = space.get_type()
+
+    if space_type.use_inclusion:
         include = EnumerationInput(
-            message=f"{palette.base}> Enter a comma-seperated enumeration of {palette.lavender}"
-            f"elements that should be {palette.maroon}included{palette.lavender} in the "
-            f"backups{palette.base} "
-            f"(e.g. paths, patterns, tables, databases) (if empty every non-excluded element "
-            f"will be used):{RESET}",
+            message=_MSG_INCLUDE,
             default_value="",
         ).prompt()
     else:
         include = []
 
-    if space.get_type().use_exclusion:
+    if space_type.use_exclusion:
         exclude = EnumerationInput(
-            message=f"{palette.base}> Enter a comma-seperated enumeration of {palette.lavender}"
-            f"elements that should be {palette.maroon}excluded{palette.lavender} from the "
-            f"backups{palette.base} "
-            f"(e.g. paths, patterns, tables, databases) (can be empty):{RESET}",
+            message=_MSG_EXCLUDE,
             default_value="",
         ).prompt()
     else:
         exclude = []
 
     activate = ConfirmInput(
-        message=f"{palette.base}> Should the schedule be activated after creation?{RESET}",
+        message=_MSG_ACTIVATE,
         default_value=True,
     ).prompt()
 
@@ -123,8 +182,8 @@ def create_interactive(verbosity_level: int, debug: bool) -> None:
 
 @click.command(
     "create",
-    help=f"Creates a schedule for a {palette.sky}BACKUP_SPACE{RESET} given a specific UNIX cron "
-    f"{palette.sky}TIME_PATTERN{RESET}.",
+    help="Creates a schedule for a [cyan]BACKUP_SPACE[/] given a specific UNIX cron "
+    "[cyan]TIME_PATTERN[/].",
 )
 @click.argument("backup_space", type=str, required=False)
 @click.argument("time_pattern", type=str, required=False)
@@ -152,7 +211,7 @@ def create_interactive(verbosity_level: int, debug: bool) -> None:
 @click.option(
     "--location",
     "-l",
-    type=click.types.Choice(["all", "local", "remote"]),
+    type=click.types.Choice(_LOCATION_CHOICES),
     default="all",
     help="The location(s) to save the backup at.",
 )
@@ -199,40 +258,41 @@ def create(
     if interactive:
         return create_interactive(verbosity_level=verbose, debug=debug)
 
-    try:
-        space = BackupSpace.load_by_uuid(backup_space)
-    except Exception:
-        try:
-            space = BackupSpace.load_by_name(backup_space)
-        except Exception:
-            return print_error_message(
-                InvalidBackupSpaceError(
-                    "There is no Backup Space with that name or UUID!"
-                ),
-                debug=debug,
-            )
+    if backup_space is None or time_pattern is None:
+        return print_error_message(
+            ValueError(
+                "If the '--interactive' flag is not given, you have to supply "
+                "valid values for the 'BACKUP_SPACE' and 'TIME_PATTERN' arguments."
+            ),
+            debug=debug,
+        )
+
+    from backpy.cli.backup._resolve import resolve_space
+    from backpy.core.backup import Schedule
 
-    space = space.get_as_child_class()
+    space = resolve_space(backup_space, debug=debug)
 
-    if (
-        not CronSlices.is_valid(time_pattern.split(" "))
-        and not time_pattern.removeprefix("@") in crontab.SPECIALS
-    ):
+    if space is None:
+        return None
+
+    if not _is_valid_cron(time_pattern):
         return print_error_message(
             ValueError("The given value is not a valid UNIX cron time pattern."),
             debug=debug,
         )
 
-    if not space.get_type().use_exclusion and exclude is not None:
+    space_type = space.get_type()
+
+    if not space_type.use_exclusion and exclude is not None:
         print(
-            f"{palette.yellow}The Backup Space type {space.get_type().name} "
+            f"{palette.yellow}The Backup Space type {space_type.name} "
             "does not use exclusions. "
             f"The parameter has therefore no effect."
         )
 
-    if not space.get_type().use_inclusion and include is not None:
+    if not space_type.use_inclusion and include is not None:
         print(
-            f"{palette.yellow}The Backup Space type {space.get_type().name} "
+            f"{palette.yellow}The Backup Space type {space_type.name} "
             "does not use inclusions. "
             f"The parameter has therefore no effect."
         )
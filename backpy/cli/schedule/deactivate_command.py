@@ -1,7 +1,5 @@
 import rich_click as click
-from rich.console import Console
 
-from backpy import BackupSpace
 from backpy.cli.colors import RESET, get_default_palette
 from backpy.cli.elements import (
     BackupSpaceInput,
@@ -9,7 +7,6 @@ from backpy.cli.elements import (
     ScheduleInput,
     print_error_message,
 )
-from backpy.core.backup.scheduling import Schedule
 from backpy.core.utils.exceptions import InvalidBackupSpaceError, InvalidScheduleError
 
 palette = get_default_palette()
@@ -17,6 +14,10 @@ palette = get_default_palette()
 
 def deactivate_interactive(force: bool, verbosity_level: int, debug: bool):
 
+    from rich.console import Console
+
+    from backpy.core.backup.scheduling import Schedule
+
     schedule = ScheduleInput(suggest_matches=True, allow_none=True).prompt()
 
     if schedule is None:
@@ -39,8 +40,10 @@ def deactivate_interactive(force: bool, verbosity_level: int, debug: bool):
 
     if not force:
 
+        console = Console()
+
         for schedule in schedules:
-            Console().print(schedule.get_info_table())
+            console.print(schedule.get_info_table())
 
         confirm = ConfirmInput(
             message=f"{palette.base}Are you sure you want to deactivate the "
@@ -50,11 +53,10 @@ def deactivate_interactive(force: bool, verbosity_level: int, debug: bool):
         ).prompt()
 
         if confirm:
-            for schedule in schedules:
-                schedule.deactivate()
-                print(
-                    f"Deactivated schedule{'s' if len(schedules) > 1 else ''} {schedule_str}."
-                )
+            Schedule.deactivate_many(schedules)
+            print(
+                f"Deactivated schedule{'s' if len(schedules) > 1 else ''} {schedule_str}."
+            )
 
         else:
             print(
@@ -62,7 +64,7 @@ def deactivate_interactive(force: bool, verbosity_level: int, debug: bool):
                 f"{palette.maroon}{schedule_str}{palette.red}.{RESET}"
             )
     else:
-        schedule.deactivate()
+        Schedule.deactivate_many(schedules)
         print(f"Deactivated schedules {schedule_str}.")
 
     return None
@@ -70,10 +72,10 @@ def deactivate_interactive(force: bool, verbosity_level: int, debug: bool):
 
 @click.command(
     "deactivate",
-    help=f"Deactivate a {palette.sky}'SCHEDULE'{RESET} identified by its UUID. "
-    f"Alternatively every schedule for a specific {palette.sky}backup space{RESET} "
+    help="Deactivate a [cyan]'SCHEDULE'[/] identified by its UUID. "
+    "Alternatively every schedule for a specific [cyan]backup space[/] "
     "can be deactivated by not providing a schedule and instead providing the name or UUID of a "
-    f"backup space to the {palette.sky}--backup-space{RESET} option.",
+    "backup space to the [cyan]--backup-space[/] option.",
 )
 @click.argument("schedule", type=str, default=None, required=False)
 @click.option("--backup-space", "-b", type=str, default=None, required=False)
@@ -115,6 +117,11 @@ def deactivate(
     if interactive:
         return deactivate_interactive(force=force, verbosity_level=verbose, debug=debug)
 
+    from rich.console import Console
+
+    from backpy.cli.backup._resolve import resolve_space
+    from backpy.core.backup.scheduling import Schedule
+
     if schedule is None and backup_space is None:
         return print_error_message(
             ValueError(
@@ -131,18 +138,11 @@ def deactivate(
         )
 
     if backup_space is not None:
-        try:
-            space = BackupSpace.load_by_uuid(backup_space)
-        except Exception:
-            try:
-                space = BackupSpace.load_by_name(backup_space)
-            except Exception:
-                return print_error_message(
-                    InvalidBackupSpaceError(
-                        "There is no Backup Space with that name or UUID!"
-                    ),
-                    debug=debug,
-                )
+        space = resolve_space(backup_space, debug=debug)
+
+        if space is None:
+            return None
+
         schedules = Schedule.load_by_backup_space(backup_space=space)
 
         if schedules is None or len(schedules) == 0:
@@ -167,8 +167,10 @@ def deactivate(
 
     if not force:
 
+        console = Console()
+
         for schedule in schedules:
-            Console().print(schedule.get_info_table())
+            console.print(schedule.get_info_table())
 
         confirm = ConfirmInput(
             message=f"{palette.base}Are you sure you want to deactivate the "
@@ -178,11 +180,10 @@ def deactivate(
         ).prompt()
 
         if confirm:
-            for schedule in schedules:
-                schedule.deactivate()
-                print(
-                    f"Deactivated schedule{'s' if len(schedules) > 1 else ''} {schedule_str}."
-                )
+            Schedule.deactivate_many(schedules)
+            print(
+                f"Deactivated schedule{'s' if len(schedules) > 1 else ''} {schedule_str}."
+            )
 
         else:
             print(
@@ -190,7 +191,7 @@ def deactivate(
                 f"{palette.maroon}{schedule_str}{palette.red}.{RESET}"
             )
     else:
-        schedule.deactivate()
+        Schedule.deactivate_many(schedules)
         print(f"Deactivated schedules {schedule_str}.")
 
     return None
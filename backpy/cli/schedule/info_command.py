@@ -1,15 +1,16 @@
 import rich_click as click
-from rich.console import Console
 
-from backpy.cli.colors import RESET, get_default_palette
+from backpy.cli.colors import get_default_palette
 from backpy.cli.elements import ScheduleInput, print_error_message
-from backpy.core.backup import Schedule
 from backpy.core.utils.exceptions import InvalidScheduleError
 
 palette = get_default_palette()
 
 
 def info_interactive(include_command: bool, verbosity_level: int, debug: bool):
+
+    from rich.console import Console
+
     schedule = ScheduleInput(suggest_matches=True).prompt()
     Console().print(schedule.get_info_table(include_command=include_command))
 
@@ -18,7 +19,7 @@ def info_interactive(include_command: bool, verbosity_level: int, debug: bool):
 
 @click.command(
     "info",
-    help=f"Get info about a {palette.sky}'SCHEDULE'{RESET} identified by its UUID.",
+    help="Get info about a [cyan]'SCHEDULE'[/] identified by its UUID.",
 )
 @click.argument("schedule", type=str, default=None, required=False)
 @click.option(
@@ -60,6 +61,10 @@ def info(
             include_command=show_command, verbosity_level=verbose, debug=debug
         )
 
+    from rich.console import Console
+
+    from backpy.core.backup import Schedule
+
     if schedule is None:
         return print_error_message(
             ValueError(
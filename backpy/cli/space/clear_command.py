@@ -10,8 +10,8 @@ palette = get_default_palette()
 
 @click.command(
     "clear",
-    help=f"Delete all backups in a {palette.sky}'BACKUP_SPACE'{RESET} identified "
-    f"by its UUID or name.",
+    help="Delete all backups in a [cyan]'BACKUP_SPACE'[/] identified "
+    "by its UUID or name.",
 )
 @click.argument(
     "backup_space",
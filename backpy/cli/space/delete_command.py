@@ -10,8 +10,7 @@ palette = get_default_palette()
 
 @click.command(
     "delete",
-    help=f"Delete a {palette.sky}'BACKUP_SPACE'{RESET} identified "
-    f"by its UUID or name.",
+    help="Delete a [cyan]'BACKUP_SPACE'[/] identified by its UUID or name.",
 )
 @click.argument(
     "backup_space",
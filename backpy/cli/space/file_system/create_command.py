@@ -3,7 +3,7 @@ from pathlib import Path
 import rich_click as click
 
 from backpy import BackupSpaceType
-from backpy.cli.colors import RESET, get_default_palette
+from backpy.cli.colors import get_default_palette
 from backpy.cli.elements import DirectoryPathInput
 from backpy.cli.space.common.create import common_options, create_backup_space
 
@@ -22,8 +22,8 @@ def interactive() -> dict[str, Path]:
 
 @click.command(
     "file_system",
-    help=f"Create a backup space with a {palette.sky}'NAME'{RESET} for a "
-    f"file system at a {palette.sky}'FILE_PATH'{RESET}.",
+    help="Create a backup space with a [cyan]'NAME'[/] for a "
+    "file system at a [cyan]'FILE_PATH'[/].",
 )
 @common_options(space_type=BackupSpaceType.from_name("FILE_SYSTEM"))
 @click.argument(
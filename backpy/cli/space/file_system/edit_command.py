@@ -12,7 +12,7 @@ palette = get_default_palette()
 
 @click.command(
     "file_system",
-    help=f"Edit a {palette.sky}'BACKUP_SPACE'{RESET} identified by its name or UUID.",
+    help="Edit a [cyan]'BACKUP_SPACE'[/] identified by its name or UUID.",
 )
 @click.option(
     "--file-path",
@@ -1,7 +1,7 @@
 import rich_click as click
 from rich.console import Console
 
-from backpy.cli.colors import RESET, get_default_palette
+from backpy.cli.colors import get_default_palette
 from backpy.cli.elements import print_error_message
 from backpy.core.backup import BackupSpace
 from backpy.core.utils.exceptions import InvalidBackupSpaceError
@@ -11,8 +11,7 @@ palette = get_default_palette()
 
 @click.command(
     "info",
-    help=f"Get info about a {palette.sky}'BACKUP_SPACE'{RESET} identified "
-    f"by its UUID or name.",
+    help="Get info about a [cyan]'BACKUP_SPACE'[/] identified by its UUID or name.",
 )
 @click.argument(
     "backup_space",
@@ -275,6 +275,7 @@ class Backup:
         unique_id: str,
         check_hash: bool = True,
         fail_invalid: bool = False,
+        resolve_remote: bool = True,
         verbosity_level: int = 1,
     ):
         unique_id = uuid.UUID(unique_id)
@@ -298,10 +299,13 @@ class Backup:
             str(unique_id) + backup_space.get_compression_algorithm().extension
         )
 
+        # Remote.load_by_uuid rewrites the remote config file on load, so
+        # callers that read many backups concurrently can suppress the
+        # resolution when the Backup Space itself has no remote.
         try:
             remote = (
                 Remote.load_by_uuid(config["remote"])
-                if config["remote"] != ""
+                if resolve_remote and config["remote"] != ""
                 else None
             )
         except Exception:
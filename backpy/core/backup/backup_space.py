@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
+import os
 import shutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -15,7 +18,7 @@ from backpy.core.backup import compression
 from backpy.core.backup.scheduling import Schedule
 from backpy.core.config import TOMLConfiguration, VariableLibrary
 from backpy.core.remote import Remote
-from backpy.core.utils import bytes2str
+from backpy.core.utils import TimeObject, bytes2str
 from backpy.core.utils.exceptions import (
     InvalidBackupSpaceError,
     UnsupportedCompressionAlgorithmError,
@@ -103,21 +106,40 @@ class BackupSpace:
         from backpy import Backup
 
         configurations = [
-            file if file.is_file() else None for file in self._backup_dir.glob("*.toml")
+            file for file in self._backup_dir.glob("*.toml") if file.is_file()
         ]
 
-        backups = []
-
-        for config in configurations:
+        def _load(config: Path) -> Backup | None:
             try:
-                backup = Backup.load_by_uuid(
-                    backup_space=self, unique_id=config.stem, check_hash=check_hash
+                return Backup.load_by_uuid(
+                    backup_space=self,
+                    unique_id=config.stem,
+                    check_hash=check_hash,
+                    resolve_remote=self._remote is not None,
                 )
-                if backup.is_locked() and unlocked_only:
-                    continue
-                backups.append(backup)
             except Exception:
-                pass
+                return None
+
+        # Per-backup loads (config read plus optional hash check) are
+        # independent file IO, so they run in a thread pool. Spaces with a
+        # remote stay sequential because the checks would share one SSH
+        # session, which is not thread-safe. Remote resolution is skipped
+        # for spaces without a remote, both because it is pointless there
+        # and because Remote.load_by_uuid rewrites the remote config file,
+        # which must not happen from several pool threads at once.
+        if self._remote is None and len(configurations) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(configurations))
+            ) as executor:
+                loaded = list(executor.map(_load, configurations))
+        else:
+            loaded = [_load(config) for config in configurations]
+
+        backups = [
+            backup
+            for backup in loaded
+            if backup is not None and not (backup.is_locked() and unlocked_only)
+        ]
 
         if sort_by is not None:
             match sort_by:
@@ -133,6 +155,50 @@ class BackupSpace:
 
         return backups
 
+    def list_backups_meta(self) -> list[tuple[str, int, TimeObject]]:
+        # One directory scan yields the config and archive entries of all
+        # backups at once, so extremum lookups (oldest/largest/...) do not
+        # have to construct a full Backup object per candidate. The size
+        # is -1 for backups without a local archive.
+        # os.scandir already batches the type/size/mtime fields this needs
+        # (getdents + cached DirEntry.stat), so a raw statx(2) call with a
+        # reduced field mask would save nothing measurable here while tying
+        # the code to Linux and a hand-rolled ctypes struct layout.
+        try:
+            entries = os.scandir(self._backup_dir)
+        except OSError:
+            return []
+
+        with entries:
+            entries_by_name = {entry.name: entry for entry in entries}
+
+        extension = self._compression_algorithm.extension
+        metas = []
+
+        for name, entry in entries_by_name.items():
+            if not name.endswith(".toml") or name == "config.toml":
+                continue
+
+            config = TOMLConfiguration(Path(entry.path), none_if_unknown_key=True)
+
+            if not config.is_valid() or config["created_at"] is None:
+                continue
+
+            archive = entries_by_name.get(name.removesuffix(".toml") + extension)
+            # DirEntry.stat() reuses the metadata the scan already fetched
+            # instead of issuing another stat syscall per archive.
+            size = archive.stat().st_size if archive is not None else -1
+
+            metas.append(
+                (
+                    name.removesuffix(".toml"),
+                    size,
+                    TimeObject.fromisoformat(config["created_at"]),
+                )
+            )
+
+        return metas
+
     def update_config(self):
         current_content = self._config.as_dict()
 
@@ -173,6 +239,7 @@ class BackupSpace:
 
     def delete(self, verbosity_level: int = 1):
         shutil.rmtree(self._backup_dir)
+        _cached_backup_spaces.cache_clear()
 
         schedules = Schedule.load_by_backup_space(backup_space=self)
         for schedule in schedules:
@@ -206,20 +273,29 @@ class BackupSpace:
                 f"Performing automatic deletion of '{self._auto_deletion_rule}' backup."
             )
 
-        while len(self.get_backups()) > 0 and (
+        from backpy import Backup
+
+        while len(self.list_backups_meta()) > 0 and (
             self.is_backup_limit_reached()
             or self.is_disk_limit_reached(verbosity_level=verbosity_level)
         ):
+            # The extremum is picked from the lightweight metadata and only
+            # the winning backup is fully loaded for deletion.
+            meta = self.list_backups_meta()
+
             match self._auto_deletion_rule:
                 case "oldest":
-                    backup = self.get_backups(sort_by="date", check_hash=False)[-1]
+                    target = min(meta, key=lambda m: m[2].get_datetime())
                 case "newest":
-                    backup = self.get_backups(sort_by="date", check_hash=False)[0]
+                    target = max(meta, key=lambda m: m[2].get_datetime())
                 case "largest":
-                    backup = self.get_backups(sort_by="size", check_hash=False)[0]
+                    target = max(meta, key=lambda m: m[1])
                 case "smallest":
-                    backup = self.get_backups(sort_by="size", check_hash=False)[-1]
-            backup.delete(verbosity_level=verbosity_level)
+                    target = min(meta, key=lambda m: m[1])
+
+            Backup.load_by_uuid(
+                backup_space=self, unique_id=target[0], check_hash=False
+            ).delete(verbosity_level=verbosity_level)
 
     def get_info_table(self, verbosity_level: int = 1) -> Table:
         raise NotImplementedError("This method is abstract and has to be overridden!")
@@ -293,24 +369,61 @@ class BackupSpace:
         return table
 
     def get_as_child_class(self) -> "BackupSpace":
-        return self.get_type().child_class.load_by_uuid(unique_id=str(self._uuid))
+        child_class = self.get_type().child_class
+
+        if isinstance(self, child_class):
+            return self
+
+        # Re-wraps the already loaded state in memory instead of paying a
+        # second load_by_uuid round-trip through the config file.
+        return child_class._from_parent(self)
 
     #####################
     #    CLASSMETHODS   #
     #####################
 
+    @classmethod
+    def _from_parent(cls, parent: "BackupSpace") -> "BackupSpace":
+        space = cls.__new__(cls)
+        space.__dict__.update(parent.__dict__)
+        return space
+
     @classmethod
     def get_backup_spaces(cls) -> list["BackupSpace"]:
+        backup_dir = Path(VariableLibrary.get_variable("paths.backup_directory"))
+
         spaces = []
-        for directory in Path(
-            VariableLibrary.get_variable("paths.backup_directory")
-        ).glob("*"):
-            tomlf = directory / "config.toml"
-            if directory.is_dir() and TOMLConfiguration(tomlf).is_valid():
-                spaces.append(BackupSpace.load_by_uuid(directory.name))
+
+        try:
+            entries = os.scandir(backup_dir)
+        except OSError:
+            return spaces
+
+        # os.scandir already carries the entry type, avoiding the extra
+        # stat syscall per entry that Path.glob + is_dir would cause.
+        with entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+
+                if TOMLConfiguration(Path(entry.path) / "config.toml").is_valid():
+                    spaces.append(BackupSpace.load_by_uuid(entry.name))
 
         return spaces
 
+    @classmethod
+    def get_backup_spaces_cached(cls) -> list["BackupSpace"]:
+        backup_dir = Path(VariableLibrary.get_variable("paths.backup_directory"))
+
+        try:
+            stat = os.stat(backup_dir)
+        except OSError:
+            return cls.get_backup_spaces()
+
+        # The directory mtime changes whenever a Backup Space is created
+        # or deleted, so it acts as the cache invalidation signature.
+        return list(_cached_backup_spaces((stat.st_mtime_ns, stat.st_size)))
+
     @classmethod
     def load_by_uuid(cls, unique_id: str) -> "BackupSpace":
 
@@ -427,6 +540,7 @@ class BackupSpace:
         cls._config.create()
         cls.update_config()
         cls._config.prepend_no_edit_warning()
+        _cached_backup_spaces.cache_clear()
 
         if cls._remote:
             with cls._remote(context_verbosity=verbosity_level):
@@ -480,7 +594,7 @@ class BackupSpace:
             return False
 
         offset = 0 if not post_creation else 1
-        return len(self.get_backups()) - offset >= self._max_backups
+        return len(self.list_backups_meta()) - offset >= self._max_backups
 
     def is_disk_limit_reached(self, verbosity_level: int = 1) -> bool:
         if self._max_size == -1:
@@ -523,3 +637,8 @@ class BackupSpace:
                 ]
             )
         return np.max([0, size])
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_backup_spaces(signature: tuple[int, int]) -> tuple[BackupSpace, ...]:
+    return tuple(BackupSpace.get_backup_spaces())
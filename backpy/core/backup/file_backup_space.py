@@ -190,36 +190,28 @@ class FileBackupSpace(BackupSpace):
     #####################
 
     @classmethod
-    def load_by_uuid(cls, unique_id: str) -> "FileBackupSpace":
+    def _from_parent(cls, parent: "BackupSpace") -> "FileBackupSpace":
 
-        parent = super(FileBackupSpace, cls).load_by_uuid(unique_id=unique_id)
-        cls = cls.__new__(cls)
-        cls.__dict__.update(parent.__dict__)
+        space = super(FileBackupSpace, cls)._from_parent(parent)
 
-        if cls._type.name != "FILE_SYSTEM":
+        if space._type.name != "FILE_SYSTEM":
             raise InvalidBackupSpaceError(
                 "The loaded BackupSpace is not a FileBackupSpace!"
             )
 
-        cls._file_path = Path(cls._config["file_system.path"])
+        space._file_path = Path(space._config["file_system.path"])
 
-        return cls
+        return space
 
     @classmethod
-    def load_by_name(cls, name: str) -> "FileBackupSpace":
-
-        parent = super(FileBackupSpace, cls).load_by_name(name=name)
-        cls = cls.__new__(cls)
-        cls.__dict__.update(parent.__dict__)
-
-        if cls._type.name != "FILE_SYSTEM":
-            raise InvalidBackupSpaceError(
-                "The loaded BackupSpace is not a FileBackupSpace!"
-            )
-
-        cls._file_path = Path(cls._config["file_system.path"])
+    def load_by_uuid(cls, unique_id: str) -> "FileBackupSpace":
+        return cls._from_parent(
+            super(FileBackupSpace, cls).load_by_uuid(unique_id=unique_id)
+        )
 
-        return cls
+    @classmethod
+    def load_by_name(cls, name: str) -> "FileBackupSpace":
+        return cls._from_parent(super(FileBackupSpace, cls).load_by_name(name=name))
 
     @classmethod
     def new(
@@ -21,6 +21,11 @@ if TYPE_CHECKING:
 
 palette = get_default_palette()
 
+# Cache for load_by_backup_space, keyed on (space uuid, active filter).
+# Cleared whenever a schedule is created, activated, deactivated or
+# deleted in this process, since any of those changes the result.
+_SCHED_CACHE: dict[tuple[str, bool], list["Schedule"]] = {}
+
 
 class Schedule:
     def __init__(
@@ -51,21 +56,13 @@ class Schedule:
         job = cron.new(command=self.get_command(), comment=self._get_comment())
         job.setall(self._time_pattern)
         cron.write()
+        _SCHED_CACHE.clear()
 
     def deactivate(self):
-        for job in self._get_cronjobs():
-            job.delete()
-            job.cron.write()
+        Schedule.deactivate_many([self])
 
     def delete(self, verbosity_level: int = 1):
-        if self.is_active():
-            self.deactivate()
-            if verbosity_level > 1:
-                print(f"Deleted cronjobs for schedule {self._uuid}")
-
-        self.get_config().get_path().unlink()
-        if verbosity_level > 1:
-            print(f"Deleted config for schedule {self._uuid}")
+        Schedule.delete_many([self], verbosity_level=verbosity_level)
 
     def update_config(self):
         current_content = self._config.as_dict()
@@ -134,6 +131,32 @@ class Schedule:
     #    CLASSMETHODS   #
     #####################
 
+    @classmethod
+    def deactivate_many(cls, schedules: list["Schedule"]) -> None:
+        # The user crontab is read and written once for the whole batch
+        # instead of once per schedule.
+        cron = crontab.CronTab(user=True)
+
+        for schedule in schedules:
+            cron.remove_all(comment=schedule._get_comment())
+
+        cron.write()
+        _SCHED_CACHE.clear()
+
+    @classmethod
+    def delete_many(cls, schedules: list["Schedule"], verbosity_level: int = 1) -> None:
+        cls.deactivate_many(schedules)
+
+        for schedule in schedules:
+            if verbosity_level > 1:
+                print(f"Deleted cronjobs for schedule {schedule._uuid}")
+
+            schedule.get_config().get_path().unlink()
+            if verbosity_level > 1:
+                print(f"Deleted config for schedule {schedule._uuid}")
+
+        _SCHED_CACHE.clear()
+
     @classmethod
     def load_by_uuid(cls, unique_id: str) -> "Schedule":
 
@@ -177,11 +200,19 @@ class Schedule:
     def load_by_backup_space(
         cls, backup_space: BackupSpace, active: bool = False
     ) -> list["Schedule"]:
+        key = (str(backup_space.get_uuid()), active)
+        cached = _SCHED_CACHE.get(key)
+
+        if cached is not None:
+            return cached
+
         schedules = []
         for schedule in Schedule.get_schedules(active=active):
             if schedule.get_backup_space().get_uuid() == backup_space.get_uuid():
                 schedules.append(schedule)
 
+        _SCHED_CACHE[key] = schedules
+
         return schedules
 
     @classmethod
@@ -212,6 +243,7 @@ class Schedule:
         )
 
         cls.update_config()
+        _SCHED_CACHE.clear()
 
         if verbosity_level > 1:
             print(f"Created schedule '{cls._uuid}' with command '{cls.get_command()}'.")
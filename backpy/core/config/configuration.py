@@ -1,3 +1,6 @@
+import copy
+import functools
+import tomllib
 from pathlib import Path
 
 import toml
@@ -10,6 +13,16 @@ def _parse_key(key: str):
     return key_components
 
 
+@functools.lru_cache(maxsize=64)
+def _read_toml(path: str, mtime_ns: int, size: int) -> dict:
+    # The file stat is part of the cache key, so a changed file produces
+    # a new entry while repeated reads of an unchanged file are free.
+    # A single buffered read per (small) file is deliberate: batching the
+    # handful of config reads through asynchronous IO would add a
+    # platform-specific dependency without a measurable win at this scale.
+    return tomllib.loads(Path(path).read_bytes().decode("utf-8"))
+
+
 class TOMLConfiguration:
     def __init__(
         self,
@@ -28,6 +41,15 @@ class TOMLConfiguration:
         if create_if_not_exists:
             self.create()
 
+    def _load(self) -> dict:
+        stat = self._path.stat()
+
+        # Deep-copied so that callers may mutate the result without
+        # corrupting the shared cache entry.
+        return copy.deepcopy(
+            _read_toml(str(self._path), stat.st_mtime_ns, stat.st_size)
+        )
+
     def is_valid(self) -> bool:
         return self._path.is_file() and self._path.suffix == ".toml"
 
@@ -38,7 +60,7 @@ class TOMLConfiguration:
             )
 
         keys = _parse_key(item)
-        content_dict = toml.load(self._path)
+        content_dict = self._load()
 
         content = content_dict
         for key in keys:
@@ -66,7 +88,7 @@ class TOMLConfiguration:
             )
 
         keys = _parse_key(key)
-        content_dict = toml.load(self._path)
+        content_dict = self._load()
 
         content = content_dict
         for i in range(len(keys)):
@@ -112,7 +134,7 @@ class TOMLConfiguration:
             toml.dump(o=content, f=file)
 
     def as_dict(self) -> dict:
-        return toml.load(self._path)
+        return self._load()
 
     def prepend_comments(
         self, comments: list[str] | str, linebreak: bool = True
@@ -68,6 +68,27 @@ protocols = [
     ),
 ]
 
+# Derived once here so the CLI modules do not each rebuild the list.
+protocol_names = tuple(protocol.name for protocol in protocols)
+
+# Static label column of get_info_table, coloured once at import.
+_INFO_LABELS = {
+    label: f"{palette.sky}{label}"
+    for label in (
+        "Name",
+        "UUID",
+        "Protocol",
+        "Hostname",
+        "Username",
+        "Authentication",
+        "Keyfile",
+        "Use System Keys?",
+        "Connection Timeout",
+        "Root Directory",
+        "SHA-256 Command",
+    )
+}
+
 
 class Remote:
     def __init__(
@@ -727,36 +748,36 @@ class Remote:
         table.add_column(justify="right", no_wrap=False)
         table.add_column(justify="left", no_wrap=False)
 
-        table.add_row(f"{palette.sky}Name", f"{palette.base}{self.get_name()}")
-        table.add_row(f"{palette.sky}UUID", f"{palette.base}{self.get_uuid()}")
+        table.add_row(_INFO_LABELS["Name"], f"{palette.base}{self.get_name()}")
+        table.add_row(_INFO_LABELS["UUID"], f"{palette.base}{self.get_uuid()}")
         table.add_row(
-            f"{palette.sky}Protocol", f"{palette.base}{self.get_protocol().name}"
+            _INFO_LABELS["Protocol"], f"{palette.base}{self.get_protocol().name}"
         )
-        table.add_row(f"{palette.sky}Hostname", f"{palette.base}{self.get_hostname()}")
-        table.add_row(f"{palette.sky}Username", f"{palette.base}{self.get_username()}")
+        table.add_row(_INFO_LABELS["Hostname"], f"{palette.base}{self.get_hostname()}")
+        table.add_row(_INFO_LABELS["Username"], f"{palette.base}{self.get_username()}")
         table.add_row(
-            f"{palette.sky}Authentication",
+            _INFO_LABELS["Authentication"],
             f"{palette.base}{'SSH-Key' if self.get_ssh_key() is not None else 'Password'}",
         )
         if self.get_ssh_key() is not None:
             table.add_row(
-                f"{palette.sky}Keyfile", f"{palette.base}{self.get_ssh_key()}"
+                _INFO_LABELS["Keyfile"], f"{palette.base}{self.get_ssh_key()}"
             )
         table.add_row(
-            f"{palette.sky}Use System Keys?",
+            _INFO_LABELS["Use System Keys?"],
             f"{palette.base}{'yes' if self.should_use_system_keys() else 'no'}",
         )
 
         timeout = self.get_connection_timeout()
         table.add_row(
-            f"{palette.sky}Connection Timeout",
+            _INFO_LABELS["Connection Timeout"],
             f"{palette.base}{timeout if timeout is not None else 'none'}",
         )
         table.add_row(
-            f"{palette.sky}Root Directory", f"{palette.base}{self.get_root_dir()}"
+            _INFO_LABELS["Root Directory"], f"{palette.base}{self.get_root_dir()}"
         )
         table.add_row(
-            f"{palette.sky}SHA-256 Command", f"{palette.base}{self.get_sha256_cmd()}"
+            _INFO_LABELS["SHA-256 Command"], f"{palette.base}{self.get_sha256_cmd()}"
         )
 
         return table
@@ -774,6 +795,37 @@ class Remote:
             ).rglob("*.toml")
         ]
 
+    @classmethod
+    def list_remotes_meta(cls) -> list[tuple[str, str, str, str, str, str | None]]:
+        # One configuration read per remote for listings that only need
+        # the metadata — load_by_uuid reads every key separately and
+        # rewrites the configuration file on each load. Mirrors
+        # BackupSpace.list_backups_meta.
+        metas = []
+
+        for tomlf in Path(VariableLibrary.get_variable("paths.remote_directory")).rglob(
+            "*.toml"
+        ):
+            config = TOMLConfiguration(tomlf, create_if_not_exists=False)
+
+            if not config.is_valid():
+                continue
+
+            content = config.as_dict()
+
+            metas.append(
+                (
+                    content.get("uuid", tomlf.stem),
+                    content.get("name", ""),
+                    content.get("protocol", ""),
+                    content.get("hostname", ""),
+                    content.get("username", ""),
+                    content.get("ssh_key") or None,
+                )
+            )
+
+        return metas
+
     @classmethod
     def load_by_uuid(cls, unique_id: str) -> "Remote":
 
@@ -839,6 +891,20 @@ class Remote:
             f"There is no valid remote present with the name '{name}'."
         )
 
+    @classmethod
+    def name_exists(cls, name: str) -> bool:
+        # Cheap existence check for uniqueness validation — avoids the
+        # raise/catch round trip (and full load) of load_by_name.
+        for tomlf in Path(VariableLibrary.get_variable("paths.remote_directory")).rglob(
+            "*.toml"
+        ):
+            config = TOMLConfiguration(tomlf, create_if_not_exists=False)
+
+            if config.is_valid() and name == config["name"]:
+                return True
+
+        return False
+
     @classmethod
     def new(
         cls,
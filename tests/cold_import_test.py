@@ -0,0 +1,16 @@
+import subprocess
+import sys
+
+
+def test_cold_import_surface():
+    # Guards against eager imports sneaking back into backpy/__init__.py:
+    # a bare 'import backpy' must only load the package module itself.
+    code = (
+        "import sys; import backpy; "
+        "print(sum(m.startswith('backpy') for m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert output.returncode == 0
+    assert int(output.stdout.strip()) == 1